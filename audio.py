@@ -2,6 +2,7 @@
 
 import csv
 import os
+import random
 import threading
 import time
 from typing import List, Tuple, Optional, Dict
@@ -37,7 +38,12 @@ class AudioManager:
         self.player = None
         self.media_list = None
         self.list_player = None
+        # Station URL -> vlc.Media, built on first play and reused afterwards
+        self._station_media = {}
+        self._playing = False
         self.command_queue = Queue()
+        # Set while command_queue has work, so the main loop can skip process_commands
+        self.cmd_event = threading.Event()
         
         # Bluetooth-related variables
         self.bluetooth_muted = False
@@ -101,34 +107,43 @@ class AudioManager:
             print("VLC not available")
             return
             
+        args = ["--quiet", "--no-video",
+                # Shorter input buffers than the 1 s default so stations and files start sooner
+                "--network-caching=300", "--file-caching=150", "--live-caching=150",
+                # Add audio normalization filter to balance loudness across all audio sources
+                "--audio-filter=normvol", "--norm-max-level=1.8", "--norm-buff-size=20"]
         if RPI_HARDWARE:
-            # Add audio normalization filter to balance loudness across all audio sources
-            self.instance = vlc.Instance("--verbose=2", "--aout=pulse",
-                                        "--audio-filter=normvol",
-                                        "--norm-max-level=1.8",
-                                        "--norm-buff-size=20")
-        else:
-            # Add audio normalization filter to balance loudness across all audio sources
-            self.instance = vlc.Instance("--verbose=2",
-                                        "--audio-filter=normvol",
-                                        "--norm-max-level=1.8",
-                                        "--norm-buff-size=20")
+            args.append("--aout=pulse")
+        self.instance = vlc.Instance(*args)
             
         self.player = self.instance.media_player_new()
         self.media_list = self.instance.media_list_new()
         self.list_player = self.instance.media_list_player_new()
         self.list_player.set_media_player(self.player)
 
+        # Track the play state from VLC events so is_playing() needs no libVLC call
+        events = self.player.event_manager()
+        events.event_attach(vlc.EventType.MediaPlayerPlaying, self._on_player_state, True)
+        for event_type in (vlc.EventType.MediaPlayerPaused,
+                           vlc.EventType.MediaPlayerStopped,
+                           vlc.EventType.MediaPlayerEndReached,
+                           vlc.EventType.MediaPlayerEncounteredError):
+            events.event_attach(event_type, self._on_player_state, False)
+
+    def _on_player_state(self, event, playing: bool):
+        """VLC event callback, runs on a libVLC thread"""
+        self._playing = playing
+
     def load_stations(self, filename: str = "stations.csv"):
         """Load internet radio stations from CSV file"""
         self.stations = []
         try:
-            with open(filename, "r", encoding="utf-8") as f:
+            with open(filename, "r", newline="", encoding="utf-8") as f:
                 reader = csv.reader(f)
                 self.stations = [
-                    AudioStation(name.strip(), url.strip())
-                    for name, url in reader
-                    if name and url  # Skip empty lines
+                    AudioStation(row[0].strip(), row[1].strip())
+                    for row in reader
+                    if len(row) >= 2 and row[0].strip()  # Skip empty lines
                 ]
         except FileNotFoundError:
             print(f"Warning: {filename} not found")
@@ -194,12 +209,8 @@ class AudioManager:
             all_files = find_audio_files_recursively(directory, max_files=100)
             
             if all_files:
-                # Shuffle the files
-                import random
-                random.shuffle(all_files)
-                
-                # Take the first 30 files (or fewer if less than 30 were found)
-                playlist_files = all_files[:30]
+                # Pick 30 random files (or all of them if fewer were found)
+                playlist_files = random.sample(all_files, min(30, len(all_files)))
                 
                 print(f"Adding {len(playlist_files)} files to playlist from recursive {source_name} scan")
                 
@@ -303,8 +314,14 @@ class AudioManager:
         """Create a playlist from SD card files starting from the given file"""
         return self._create_playlist(start_file, self.sd_card_files, self.sd_card_dir, is_sd_card=True)
 
+    def _enqueue(self, command: AudioCommand):
+        self.command_queue.put(command)
+        self.cmd_event.set()
+
     def process_commands(self):
         """Process any pending audio commands - should be called from main thread"""
+        # Cleared before draining: a command queued meanwhile sets it again
+        self.cmd_event.clear()
         try:
             while True:  # Process all pending commands
                 command = self.command_queue.get_nowait()
@@ -326,7 +343,7 @@ class AudioManager:
 
     def play_station(self, station: AudioStation):
         """Queue a command to play a radio station"""
-        self.command_queue.put(AudioCommand(AudioCommandType.PLAY_STATION, station))
+        self._enqueue(AudioCommand(AudioCommandType.PLAY_STATION, station))
 
     def _play_media(self, file: AudioFile, is_sd_card: bool = False):
         """Common code for playing a file from USB or SD card"""
@@ -367,7 +384,7 @@ class AudioManager:
                 return
                 
         # Fallback to regular file playing
-        self.command_queue.put(AudioCommand(AudioCommandType.PLAY_FILE, file))
+        self._enqueue(AudioCommand(AudioCommandType.PLAY_FILE, file))
 
     def play_file(self, file: AudioFile):
         """Play a file from USB"""
@@ -379,19 +396,19 @@ class AudioManager:
 
     def stop(self):
         """Stop playback"""
-        self.command_queue.put(AudioCommand(AudioCommandType.STOP))
+        self._enqueue(AudioCommand(AudioCommandType.STOP))
 
     def toggle_pause(self):
         """Toggle pause/play state"""
-        self.command_queue.put(AudioCommand(AudioCommandType.TOGGLE_PAUSE))
+        self._enqueue(AudioCommand(AudioCommandType.TOGGLE_PAUSE))
 
     def mute_bluetooth(self):
         """Mute Bluetooth audio"""
-        self.command_queue.put(AudioCommand(AudioCommandType.MUTE_BLUETOOTH))
+        self._enqueue(AudioCommand(AudioCommandType.MUTE_BLUETOOTH))
 
     def unmute_bluetooth(self):
         """Unmute Bluetooth audio"""
-        self.command_queue.put(AudioCommand(AudioCommandType.UNMUTE_BLUETOOTH))
+        self._enqueue(AudioCommand(AudioCommandType.UNMUTE_BLUETOOTH))
 
     def _mute_bluetooth(self):
         """Temporarily disable Bluetooth audio output"""
@@ -418,8 +435,11 @@ class AudioManager:
             # Stop any existing playback
             self._stop()
             
-            # Create media without additional options (they're already set in the instance)
-            media = self.instance.media_new(station.url)
+            # Media has no additional options (they're already set in the instance),
+            # so one per station can be reused on every switch
+            media = self._station_media.get(station.url)
+            if media is None:
+                media = self._station_media[station.url] = self.instance.media_new(station.url)
             self.player.set_media(media)
             self.player.play()
             print(f"Playing station: {station.name}. VLC play() called")
@@ -620,7 +640,7 @@ class AudioManager:
 
     def is_playing(self) -> bool:
         """Check if currently playing"""
-        return self.player and self.player.is_playing() == 1
+        return self._playing
 
     def get_current_info(self) -> Tuple[str, str]:
         """Get current playing info (source, name)"""
@@ -5,6 +5,11 @@ from dataclasses import dataclass
 import os
 from typing import Any
 
+__all__ = (
+    "BACK", "THIS_DIR", "FILE_PATH_PREFIX", "SUPPORTED_AUDIO_EXTENSIONS",
+    "AudioSource", "AudioFile", "AudioStation", "AudioCommandType", "AudioCommand",
+)
+
 # Constants
 BACK = "<zurück>"
 THIS_DIR = "<dieser Ordner>"
@@ -18,6 +23,9 @@ class AudioSource(Enum):
 
 
 class AudioFile:
+    # One instance per listed file, so no per-instance __dict__
+    __slots__ = ('path', 'is_dir', 'is_special', 'name')
+
     def __init__(self, path: str, is_dir: bool = False, name: str = None, is_special: bool = False):
         self.path = path
         self.is_dir = is_dir
@@ -26,6 +34,8 @@ class AudioFile:
 
 
 class AudioStation:
+    __slots__ = ('name', 'url')
+
     def __init__(self, name: str, url: str):
         self.name = name
         self.url = url
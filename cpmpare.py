@@ -6,6 +6,7 @@ import subprocess
 import RPi.GPIO as GPIO
 from display import OLEDDisplay, PygameDisplay
 from gpio_pins import ROTARY1_A, ROTARY1_B, ROTARY1_SW
+from encoder_core import step
 
 # For timing measurements
 last_frame_time = time.time()
@@ -96,8 +97,6 @@ class VolumeControl:
         return self._volume
 
 class RotaryEncoder:
-    SEQ_CW = [0b11, 0b10, 0b00, 0b01]  # 3,2,0,1
-    
     def __init__(self, pin_a, pin_b, callback):
         self.pin_a = pin_a
         self.pin_b = pin_b
@@ -134,29 +133,20 @@ class RotaryEncoder:
                 
             # Position changed
             if position != self.last_position:
-                try:
-                    # Find positions in sequence
-                    old_idx = self.SEQ_CW.index(self.last_position)
-                    new_idx = self.SEQ_CW.index(position)
-                    
-                    # Compute step
-                    step = (new_idx - old_idx) % 4
-                    if step == 1:  # Next in sequence = CW
-                        self.turn_count += 1
-                        if self.turn_count >= 2:  # Complete rotation
-                            self.turn_count = 0
-                            with self._lock:
-                                self.accumulated_turns += 1
-                    elif step == 3:  # Previous in sequence = CCW
-                        self.turn_count -= 1
-                        if self.turn_count <= -2:  # Complete rotation
-                            self.turn_count = 0
-                            with self._lock:
-                                self.accumulated_turns -= 1
-                    else:  # Invalid sequence
+                delta = step(self.last_position, position)
+                if delta == 1:  # Next in sequence = CW
+                    self.turn_count += 1
+                    if self.turn_count >= 2:  # Complete rotation
+                        self.turn_count = 0
+                        with self._lock:
+                            self.accumulated_turns += 1
+                elif delta == -1:  # Previous in sequence = CCW
+                    self.turn_count -= 1
+                    if self.turn_count <= -2:  # Complete rotation
                         self.turn_count = 0
-                except ValueError:
-                    # Invalid position, reset counter
+                        with self._lock:
+                            self.accumulated_turns -= 1
+                else:  # Invalid sequence
                     self.turn_count = 0
                     
                 self.last_position = position
@@ -3,7 +3,6 @@
 from typing import Optional
 from pygame_manager import PygameManager
 import numpy as np
-import time
 import threading
 try:
     import pygame  # Ensure pygame is available when using PygameDisplay
@@ -29,6 +28,13 @@ from font_8x16 import FONT_8X16, get_char as get_char_8x16, get_text_width as ge
 class DisplayBuffer:
     """Emulates a 1-bit display buffer like the SSD1306"""
 
+    # (size, char) -> glyph as column bit masks (bit n = row n), shared by all buffers
+    _glyph_cache = {}
+    # (size, text) -> whole line in the same form, gaps between glyphs are None.
+    # Labels and the clock repeat every frame; emptied when full
+    _text_cache = {}
+    TEXT_CACHE_SIZE = 128
+
     def __init__(self, width: int, height: int):
         self.width = width
         self.height = height
@@ -69,23 +75,83 @@ class DisplayBuffer:
             for dx, pixel in enumerate(row):
                 self.set_pixel(x + dx, y + dy, pixel != inverted)
 
+    # Font size -> (glyph lookup, horizontal advance per character)
+    FONTS = {
+        "5x8": (get_char_5x8, 6),
+        "8x16": (get_char_8x16, 9),
+    }
+
     def draw_text(self, x: int, y: int, text: str, inverted: bool = False, size: str = "5x8"):
         """Draw text using bitmap font"""
-        cursor_x = x
-        
-        if size == "5x8":
-            get_char = get_char_5x8
-            char_width = 6
-        elif size == "8x16":
-            get_char = get_char_8x16
-            char_width = 9
-        else:
-            raise ValueError("Font size must be '5x8' or '8x16'")
-            
+        line = self._text_cache.get((size, text))
+        if line is None:
+            line = self._text_columns(text, size)
+        self.draw_columns(x, y, line, inverted)
+
+    def _text_columns(self, text: str, size: str) -> tuple:
+        """Build and cache the column masks of a whole line of text"""
+        try:
+            get_char, char_width = self.FONTS[size]
+        except KeyError:
+            raise ValueError("Font size must be '5x8' or '8x16'") from None
+
+        glyph_cache = self._glyph_cache
+        height = 0
+        columns = []
         for char in text:
-            bitmap = get_char(char)
-            self.draw_bitmap(cursor_x, y, bitmap, inverted)
-            cursor_x += char_width
+            glyph = glyph_cache.get((size, char))
+            if glyph is None:
+                glyph = glyph_cache[(size, char)] = self._glyph_columns(get_char(char))
+            height, glyph_columns = glyph
+            columns.extend(glyph_columns)
+            columns.extend([None] * (char_width - len(glyph_columns)))
+
+        if len(self._text_cache) >= self.TEXT_CACHE_SIZE:
+            self._text_cache.clear()
+        line = self._text_cache[(size, text)] = (height, tuple(columns))
+        return line
+
+    @staticmethod
+    def _glyph_columns(bitmap: list) -> tuple:
+        """Convert a row-major bitmap to (height, column masks)"""
+        columns = [0] * len(bitmap[0])
+        for dy, row in enumerate(bitmap):
+            for dx, pixel in enumerate(row):
+                if pixel:
+                    columns[dx] |= 1 << dy
+        return len(bitmap), tuple(columns)
+
+    def draw_columns(self, x: int, y: int, glyph: tuple, inverted: bool = False):
+        """Draw a glyph or line from _glyph_columns/_text_columns, writing whole page
+        bytes like draw_bitmap writes pixels: set where the glyph is on, cleared where
+        it is off. None columns are left untouched."""
+        height, columns = glyph
+        full = (1 << height) - 1
+        if y < 0:
+            # Rare, not worth shifting the masks the other way
+            for dx, column in enumerate(columns):
+                if column is None:
+                    continue
+                if inverted:
+                    column ^= full
+                for dy in range(height):
+                    self.set_pixel(x + dx, y + dy, (column >> dy) & 1)
+            return
+        mask = full << y
+        first_page = y // 8
+        last_page = min((y + height - 1) // 8, self.pages - 1)
+        buffer = self.buffer
+        width = self.width
+        for dx, column in enumerate(columns):
+            cx = x + dx
+            if column is None or not 0 <= cx < width:
+                continue
+            bits = ((column ^ full) if inverted else column) << y
+            for page in range(first_page, last_page + 1):
+                shift = page * 8
+                page_mask = (mask >> shift) & 0xFF
+                idx = cx + page * width
+                buffer[idx] = (buffer[idx] & ~page_mask) | ((bits >> shift) & 0xFF)
 
     def draw_rect(self, x: int, y: int, w: int, h: int, fill: bool = False):
         """Draw a rectangle"""
@@ -122,40 +188,50 @@ class PygameDisplay(Display):
         self.pygame = PygameManager.get_instance()
         if pygame is None:
             raise ImportError("pygame is required for PygameDisplay but is not installed")
-        self.screen = pygame.display.set_mode((width * scale, height * scale))
+        if hasattr(pygame, "SCALED"):
+            # SDL upscales the logical width x height screen to the window on the GPU,
+            # we draw straight onto it
+            self.screen = pygame.display.set_mode((width, height), pygame.SCALED | pygame.RESIZABLE)
+            # SCALED picks its own window size, open it at the requested scale instead
+            try:
+                from pygame._sdl2.video import Window
+                Window.from_display_module().size = (width * scale, height * scale)
+            except (ImportError, AttributeError, pygame.error) as e:
+                print(f"Warning: Could not resize display window: {e}")
+            self.base_surface = None
+            self.scaled_surface = None
+        else:
+            # pygame 1.x: scale in software through preallocated surfaces
+            self.screen = pygame.display.set_mode((width * scale, height * scale))
+            self.base_surface = pygame.Surface((width, height))
+            self.scaled_surface = pygame.Surface((width * scale, height * scale))
         pygame.display.set_caption("RadioWecker Display Emulation")
         self.pygame.set_screen(self.screen)
         
-        # Create optimized surfaces
-        self.base_surface = pygame.Surface((width, height))
-        self.scaled_surface = pygame.Surface((width * scale, height * scale))
-        
-        # Pre-allocate buffer array
-        self.surface_array = np.zeros((height, width), dtype=np.uint8)
+        # Pre-allocate buffer array, indexed [x, y] like the surface, raw pixel values
+        self.surface_array = np.zeros((width, height), dtype=np.uint32)
 
     def show(self):
-        try:
-            # Convert display buffer to numpy array in one operation
-            buffer = self.buffer.get_buffer()
-            for page in range(self.height // 8):
-                for x in range(self.width):
-                    byte = buffer[x + page * self.width]
-                    for bit in range(8):
-                        y = page * 8 + bit
-                        if y < self.height:
-                            self.surface_array[y, x] = 255 if byte & (1 << bit) else 0
-            
-            # Update surface directly from array
+        # Window already closed (pygame.quit), nothing to draw on
+        if not pygame.display.get_init():
+            return
+
+        # Convert display buffer to numpy array in one operation: unpack each page
+        # byte into its 8 rows (LSB = top row), then lay out [x, y] like the surface
+        pages = np.frombuffer(self.buffer.get_buffer(), np.uint8).reshape(-1, 1, self.width)
+        rows = np.unpackbits(pages, axis=1, bitorder='little').reshape(-1, self.width)
+        np.multiply(rows[:self.height].T, np.uint32(0xFFFFFF), out=self.surface_array)
+
+        if self.scaled_surface is None:
+            # Update the logical screen directly from array, SDL does the scaling
+            pygame.surfarray.blit_array(self.screen, self.surface_array)
+        else:
             pygame.surfarray.blit_array(self.base_surface, self.surface_array)
-            
-            # Scale and display
-            pygame.transform.scale(self.base_surface, 
-                                (self.width * self.scale, self.height * self.scale), 
+            pygame.transform.scale(self.base_surface,
+                                (self.width * self.scale, self.height * self.scale),
                                 self.scaled_surface)
             self.screen.blit(self.scaled_surface, (0, 0))
-            pygame.display.flip()
-        except:
-            pass
+        pygame.display.flip()
 
 
 class OLEDDisplay(Display):
@@ -195,8 +271,9 @@ class OLEDDisplay(Display):
                 self.display_buffer = bytearray(self.width * self.buffer.pages)
                 self.last_buffer = bytearray(self.width * self.buffer.pages)
                 
-                # Setup display thread
-                self._update_requested = False
+                # Setup display thread, woken by show() when there is a new frame
+                self._send_buffer = bytearray(self.width * self.buffer.pages)
+                self._update_event = threading.Event()
                 self._display_lock = threading.Lock()
                 self._display_thread = threading.Thread(target=self._display_update_thread, daemon=True)
                 self._display_thread.start()
@@ -210,89 +287,66 @@ class OLEDDisplay(Display):
     def _display_update_thread(self):
         """Background thread for display updates"""
         while True:
-            # Check if update is needed
+            self._update_event.wait()
+            # Take the latest frame, show() may replace it while it is sent
             with self._display_lock:
-                if self._update_requested:
-                    try:
-                        # Write entire buffer in one operation
-                        self.device.data(self.display_buffer)
-                        self._update_requested = False
-                    except Exception as e:
-                        print(f"Display update failed: {e}")
-            
-            # Small sleep to prevent CPU hogging
-            time.sleep(0.001)
+                self._update_event.clear()
+                self._send_buffer[:] = self.display_buffer
+            try:
+                # Write entire buffer in one operation
+                self.device.data(self._send_buffer)
+            except Exception as e:
+                print(f"Display update failed: {e}")
 
     def _init_display(self):
         """Initialize display with optimal settings"""
-        self.device.command(self.SET_DISP | 0x00)  # display off
-        
-        # Hardware configuration
-        self.device.command(self.SET_DISP_CLK_DIV)
-        self.device.command(0x80)  # Suggested ratio
-        
-        self.device.command(self.SET_MUX_RATIO)
-        self.device.command(self.height - 1)
-        
-        self.device.command(self.SET_DISP_OFFSET)
-        self.device.command(0x00)
-        
-        self.device.command(self.SET_DISP_START_LINE | 0x00)
-        self.device.command(self.SET_CHARGE_PUMP)
-        self.device.command(0x14)  # Enable charge pump
-        
-        # Memory addressing settings - set once during init
-        self.device.command(self.SET_MEM_ADDR)
-        self.device.command(0x00)  # Horizontal addressing mode
-        
-        # Set full display address range once during init
-        self.device.command(self.SET_COL_ADDR)
-        self.device.command(0)
-        self.device.command(self.width - 1)
-        self.device.command(self.SET_PAGE_ADDR)
-        self.device.command(0)
-        self.device.command(self.buffer.pages - 1)
-        
-        # Set segment re-map: column address 127 is mapped to SEG0
-        self.device.command(self.SET_SEG_REMAP | 0x00)  # No flip
-        
-        # Set COM output scan direction: normal mode
-        self.device.command(self.SET_COM_OUT_DIR | 0x00)  # Normal mode
-        
-        self.device.command(self.SET_COM_PIN_CFG)
-        self.device.command(0x12)
-        
-        self.device.command(self.SET_CONTRAST)
-        self.device.command(0xCF)
-        
-        self.device.command(self.SET_PRECHARGE)
-        self.device.command(0xF1)
-        
-        self.device.command(self.SET_VCOM_DESEL)
-        self.device.command(0x40)
-        
-        # Display settings
-        self.device.command(self.SET_ENTIRE_ON)  # Output follows RAM
-        self.device.command(self.SET_NORM_INV)   # Not inverted
-        self.device.command(self.SET_DISP | 0x01)  # Display on
+        # A multi-byte command() is a single I2C transaction; the whole sequence
+        # is 31 bytes, within the 32-byte block limit
+        self.device.command(
+            self.SET_DISP | 0x00,                   # display off
+            # Hardware configuration
+            self.SET_DISP_CLK_DIV, 0x80,            # Suggested ratio
+            self.SET_MUX_RATIO, self.height - 1,
+            self.SET_DISP_OFFSET, 0x00,
+            self.SET_DISP_START_LINE | 0x00,
+            self.SET_CHARGE_PUMP, 0x14,             # Enable charge pump
+            # Memory addressing settings - set once during init
+            self.SET_MEM_ADDR, 0x00,                # Horizontal addressing mode
+            # Set full display address range once during init
+            self.SET_COL_ADDR, 0, self.width - 1,
+            self.SET_PAGE_ADDR, 0, self.buffer.pages - 1,
+            # Set segment re-map: column address 127 is mapped to SEG0
+            self.SET_SEG_REMAP | 0x00,              # No flip
+            # Set COM output scan direction: normal mode
+            self.SET_COM_OUT_DIR | 0x00,            # Normal mode
+            self.SET_COM_PIN_CFG, 0x12,
+            self.SET_CONTRAST, 0xCF,
+            self.SET_PRECHARGE, 0xF1,
+            self.SET_VCOM_DESEL, 0x40,
+            # Display settings
+            self.SET_ENTIRE_ON,                     # Output follows RAM
+            self.SET_NORM_INV,                      # Not inverted
+            self.SET_DISP | 0x01,                   # Display on
+        )
 
     def show(self):
         if not self.device:
             return
             
         try:
-            # Copy buffer directly (no flipping needed anymore)
-            self.display_buffer[:] = self.buffer.get_buffer()
-            
+            # The buffer is already in SSD1306 page layout (no flipping needed anymore)
+            frame = self.buffer.get_buffer()
+
             # Only update if buffer changed
-            if self.display_buffer != self.last_buffer:
+            if frame != self.last_buffer:
                 # Save current buffer
-                self.last_buffer[:] = self.display_buffer[:]
-                
+                self.last_buffer[:] = frame
+
                 # Request update in background thread
                 with self._display_lock:
-                    self._update_requested = True
-                
+                    self.display_buffer[:] = frame
+                self._update_event.set()
+
         except Exception as e:
             print(f"Display update failed: {e}")
             pass
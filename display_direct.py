@@ -58,9 +58,10 @@ class DirectOLED:
         self._init_display()
         
     def _command(self, *cmd):
-        """Send command to display"""
-        for c in cmd:
-            self.i2c.write_byte_data(self.address, 0x00, c)
+        """Send commands to display, batched into block writes after one control byte"""
+        # SMBus block writes carry at most 32 bytes
+        for i in range(0, len(cmd), 32):
+            self.i2c.write_i2c_block_data(self.address, 0x00, list(cmd[i:i + 32]))
             
     def _data(self, data):
         """Send data to display using page mode"""
@@ -68,53 +69,29 @@ class DirectOLED:
         chunk_size = 32
         for i in range(0, len(data), chunk_size):
             chunk = data[i:i + chunk_size]
-            # Create write command with data byte
-            cmd = [0x40] + list(chunk)  # 0x40 is the data mode
-            self.i2c.write_i2c_block_data(self.address, 0x40, list(chunk))
+            self.i2c.write_i2c_block_data(self.address, 0x40, list(chunk))  # 0x40 is the data mode
             
     def _init_display(self):
         """Initialize display with optimal settings"""
-        # Display off
-        self._command(0xAE)
-        
-        # Set clock div and oscillator
-        self._command(0xD5, 0x80)
-        
-        # Set multiplex ratio
-        self._command(0xA8, self.height - 1)
-        
-        # Set display offset
-        self._command(0xD3, 0x00)
-        
-        # Set start line
-        self._command(0x40)
-        
-        # Enable charge pump
-        self._command(0x8D, 0x14)
-        
-        # Set memory mode to horizontal
-        self._command(0x20, 0x00)
-        
-        # Normal display direction
-        self._command(0xA0)  # Normal segment mapping
-        self._command(0xC0)  # Normal COM direction
-        
-        # Set contrast
-        self._command(0x81, 0xCF)
-        
-        # Set precharge
-        self._command(0xD9, 0xF1)
-        
-        # Set COM pins
-        self._command(0xDA, 0x12)
-        
-        # Set VCOM detect
-        self._command(0xDB, 0x40)
-        
-        # Display on
-        self._command(0xA4)  # Display ON with RAM content
-        self._command(0xA6)  # Normal display (not inverted)
-        self._command(0xAF)  # Display on
+        # The whole init sequence goes out in a single I2C transaction
+        self._command(
+            0xAE,               # Display off
+            0xD5, 0x80,         # Set clock div and oscillator
+            0xA8, self.height - 1,  # Set multiplex ratio
+            0xD3, 0x00,         # Set display offset
+            0x40,               # Set start line
+            0x8D, 0x14,         # Enable charge pump
+            0x20, 0x00,         # Set memory mode to horizontal
+            0xA0,               # Normal segment mapping
+            0xC0,               # Normal COM direction
+            0x81, 0xCF,         # Set contrast
+            0xD9, 0xF1,         # Set precharge
+            0xDA, 0x12,         # Set COM pins
+            0xDB, 0x40,         # Set VCOM detect
+            0xA4,               # Display ON with RAM content
+            0xA6,               # Normal display (not inverted)
+            0xAF,               # Display on
+        )
         
     def show(self):
         """Update display with current buffer"""
@@ -123,11 +100,9 @@ class DirectOLED:
         
         # Only update if buffer changed
         if self.display_buffer != self.last_buffer:
-            # Set column address
-            self._command(0x21, 0, self.width - 1)
-            
-            # Set page address
-            self._command(0x22, 0, self.pages - 1)
+            # Set column and page address
+            self._command(0x21, 0, self.width - 1,
+                          0x22, 0, self.pages - 1)
             
             # Write display buffer
             self._data(self.display_buffer)
@@ -0,0 +1,28 @@
+"""Shared quadrature decoding for the rotary encoder test scripts"""
+
+# Encoder positions are (MSB) pin_a,pin_b (LSB); clockwise runs 3,2,0,1,3.
+# Step for a (last_position << 2) | position transition:
+# +1 = next in clockwise sequence, -1 = previous, 0 = no change or invalid jump
+QUAD_TABLE = (
+     0, +1, -1,  0,
+    -1,  0,  0, +1,
+    +1,  0,  0, -1,
+     0, -1, +1,  0,
+)
+
+try:
+    import numpy as np
+    from numba import njit
+
+    _LUT = np.array(QUAD_TABLE, dtype=np.int8)
+
+    @njit(cache=True)
+    def step(last_position, position):
+        """Step (-1, 0, +1) for a transition between two encoder positions"""
+        return _LUT[(last_position << 2) | position]
+except ImportError:
+    _LUT = QUAD_TABLE
+
+    def step(last_position, position):
+        """Step (-1, 0, +1) for a transition between two encoder positions"""
+        return _LUT[(last_position << 2) | position]
@@ -1,25 +1,34 @@
 #!/usr/bin/env python3
 
+import sys
 import time
-import subprocess
+import threading
+import alsaaudio
 import RPi.GPIO as GPIO
 from gpio_pins import ROTARY1_A, ROTARY1_B
+from encoder_core import step
 import numpy as np
 
-# Debug output
-def debug(msg):
-    print(f"{time.time():.3f}: {msg}")
+# Debug output - hot-path calls are guarded with `if DEBUG:` so nothing is
+# formatted per transition unless this is switched on
+DEBUG = False
+
+if DEBUG:
+    def debug(msg):
+        sys.stderr.write("%.3f: %s\n" % (time.time(), msg))
+else:
+    def debug(msg):
+        pass
 
 class RotaryEncoder:
-    # Encoder sequence for clockwise rotation: 3,2,0,1,3
-    # Each position: (MSB) pin_a,pin_b (LSB)
-    SEQ_CW = [0b11, 0b10, 0b00, 0b01]  # 3,2,0,1
-    
     def __init__(self, pin_a, pin_b):
         self.pin_a = pin_a
         self.pin_b = pin_b
         self.value = 50  # Start at 50%
-        self.last_time = time.time()
+        # Bound once; update() runs on every edge
+        self._gpio_input = GPIO.input
+        self._now = time.monotonic
+        self.last_time = self._now()
         self.last_position = -1
         self.turn_count = 0
         
@@ -31,6 +40,15 @@ class RotaryEncoder:
         GPIO.setup(pin_a, GPIO.IN, pull_up_down=GPIO.PUD_UP)
         GPIO.setup(pin_b, GPIO.IN, pull_up_down=GPIO.PUD_UP)
         
+        # Open the mixer once instead of spawning amixer on every tick
+        self._mixer = None
+        for control in ('PCM', 'Master'):
+            try:
+                self._mixer = alsaaudio.Mixer(control)
+                break
+            except alsaaudio.ALSAAudioError:
+                continue
+        
         # Get initial position
         self._read_position()
         
@@ -39,9 +57,8 @@ class RotaryEncoder:
 
     def _read_position(self):
         """Read current position in sequence (0-3)"""
-        a = GPIO.input(self.pin_a)
-        b = GPIO.input(self.pin_b)
-        return (a << 1) | b
+        gpio_input = self._gpio_input
+        return (gpio_input(self.pin_a) << 1) | gpio_input(self.pin_b)
 
     def update(self):
         """Check encoder state and return change (-2, 0, or +2)"""
@@ -54,31 +71,30 @@ class RotaryEncoder:
             
         # Position changed
         if position != self.last_position:
-            current_time = time.time()
-            dt = current_time - self.last_time
-            debug(f"Position: {position} (was {self.last_position}) dt={dt*1000:.1f}ms")
-            
-            # Find positions in sequence
-            old_idx = self.SEQ_CW.index(self.last_position)
-            new_idx = self.SEQ_CW.index(position)
+            current_time = self._now()
+            if DEBUG:
+                dt = current_time - self.last_time
+                debug(f"Position: {position} (was {self.last_position}) dt={dt*1000:.1f}ms")
             
             # Compute step
-            step = (new_idx - old_idx) % 4
-            if step == 1:  # Next in sequence = CW
+            delta = step(self.last_position, position)
+            if delta == 1:  # Next in sequence = CW
                 self.turn_count += 1
                 if self.turn_count >= 2:  # Complete rotation
                     self.turn_count = 0
                     self.value = min(100, self.value + 2)
-                    debug(f"CW -> {self.value}%")
+                    if DEBUG:
+                        debug(f"CW -> {self.value}%")
                     self.last_position = position
                     self.last_time = current_time
                     return 2
-            elif step == 3:  # Previous in sequence = CCW
+            elif delta == -1:  # Previous in sequence = CCW
                 self.turn_count -= 1
                 if self.turn_count <= -2:  # Complete rotation
                     self.turn_count = 0
                     self.value = max(0, self.value - 2)
-                    debug(f"CCW -> {self.value}%")
+                    if DEBUG:
+                        debug(f"CCW -> {self.value}%")
                     self.last_position = position
                     self.last_time = current_time
                     return -2
@@ -93,25 +109,11 @@ class RotaryEncoder:
     def set_volume(self, volume):
         """Set volume and return actual value set"""
         volume = max(0, min(100, volume))
+        if self._mixer is None:
+            return volume
         try:
-            # Try different mixer controls
-            for control in ['PCM', 'Master']:
-                try:
-                    cmd = ['amixer', '-M', 'get', control]
-                    debug(f"Running: {' '.join(cmd)}")
-                    output = subprocess.check_output(cmd).decode()
-                    debug(f"Output: {output.strip()}")
-                    
-                    # If we got here, the control exists
-                    cmd = ['amixer', '-M', 'set', control, f'{volume}%']
-                    debug(f"Running: {' '.join(cmd)}")
-                    output = subprocess.check_output(cmd).decode()
-                    debug(f"Output: {output.strip()}")
-                    return volume
-                except subprocess.CalledProcessError as e:
-                    debug(f"Failed: {e}")
-                    continue
-        except Exception as e:
+            self._mixer.setvolume(volume)
+        except alsaaudio.ALSAAudioError as e:
             debug(f"Error: {e}")
         return volume
 
@@ -121,7 +123,16 @@ def main():
         encoder = RotaryEncoder(ROTARY1_A, ROTARY1_B)
         times = np.array([])
 
+        # Wake up on edges of either pin instead of polling every 1ms
+        edge = threading.Event()
+        for pin in (encoder.pin_a, encoder.pin_b):
+            GPIO.add_event_detect(pin, GPIO.BOTH, callback=lambda channel: edge.set())
+
         while True:
+            # Block until a pin changes (timeout keeps Ctrl+C responsive)
+            edge.wait(0.1)
+            edge.clear()
+
             # Check encoder
             times = np.append(times, time.time())
             change = encoder.update()
@@ -131,9 +142,6 @@ def main():
                 new_volume = encoder.value
                 # encoder.set_volume(new_volume)
             
-            # Small sleep to prevent CPU hogging
-            time.sleep(0.0001)  # 1ms polling
-            
     except KeyboardInterrupt:
         print("\nExiting...")
         # calculate average time between updates
@@ -1,16 +1,26 @@
 # file_system.py - File system operations related to audio files
 
 import os
+from collections import OrderedDict
 from pathlib import Path
 from typing import List
-import random
 from audio_types import AudioFile, SUPPORTED_AUDIO_EXTENSIONS, BACK, THIS_DIR
 
+# Lower-case extensions including the dot, for a single set lookup per name
+_AUDIO_EXTS = frozenset(ext.lower() for ext in SUPPORTED_AUDIO_EXTENSIONS)
+
+# Listings of recently visited directories, keyed on (directory, root_path, mtime).
+# Adding, removing or renaming an entry changes the directory's mtime.
+_SCAN_CACHE_SIZE = 64
+_scan_cache = OrderedDict()
+
 
 def is_audio_file(filename: str) -> bool:
     """Check if a file is an audio file based on its extension"""
-    ext = os.path.splitext(filename)[1].lower()
-    return ext in SUPPORTED_AUDIO_EXTENSIONS
+    # Only the extension is lower-cased, not the whole name. Like os.path.splitext,
+    # leading dots don't start an extension, so ".mp3" is not an audio file
+    dot = filename.rfind('.')
+    return dot > 0 and filename[dot:].lower() in _AUDIO_EXTS and filename[:dot].lstrip('.') != ""
 
 
 def scan_directory(directory: str, is_sd_card: bool = False, 
@@ -24,9 +34,20 @@ def scan_directory(directory: str, is_sd_card: bool = False,
         print(f"{current_storage_name} directory does not exist: {directory}")
         result.append(AudioFile(name=f"{current_storage_name} not mounted", path=directory, is_special=True))
         return result
-        
+
     try:
-        entries = os.listdir(directory)
+        cache_key = (directory, root_path, os.stat(directory).st_mtime_ns)
+    except OSError:
+        cache_key = None
+    cached = _scan_cache.get(cache_key)
+    if cached is not None:
+        _scan_cache.move_to_end(cache_key)
+        return list(cached)
+
+    try:
+        # scandir caches the entry type, so is_dir()/is_file() usually need no stat
+        with os.scandir(directory) as it:
+            entries = sorted(it, key=lambda entry: entry.name)
     except PermissionError:
         print(f"Permission denied: {directory}")
         result.append(AudioFile(name="Permission denied", path=directory, is_special=True))
@@ -44,22 +65,27 @@ def scan_directory(directory: str, is_sd_card: bool = False,
     if directory != root_path:
         result.append(AudioFile(name=BACK, path=directory, is_special=True))
 
-    # Add directories
-    for entry in sorted(entries):
-        path = os.path.join(directory, entry)
-        if os.path.isdir(path) and not entry.startswith('.'):
-            result.append(AudioFile(name=entry, path=path, is_dir=True))
-
-    # Add audio files
-    for entry in sorted(entries):
-        path = os.path.join(directory, entry)
-        if os.path.isfile(path) and is_audio_file(entry):
-            result.append(AudioFile(name=entry, path=path))
+    # Directories first, then audio files - collected in a single pass
+    dirs = []
+    files = []
+    for entry in entries:
+        name = entry.name
+        if entry.is_dir():
+            if not name.startswith('.'):
+                dirs.append(AudioFile(name=name, path=entry.path, is_dir=True))
+        elif entry.is_file() and is_audio_file(name):
+            files.append(AudioFile(name=name, path=entry.path))
+    result.extend(dirs)
+    result.extend(files)
                                  
     # If no files or directories were found (empty directory)
     if len(result) == 0:
         result.append(AudioFile(name="Empty directory", path=directory, is_special=True))
-        
+
+    if cache_key is not None:
+        _scan_cache[cache_key] = list(result)
+        if len(_scan_cache) > _SCAN_CACHE_SIZE:
+            _scan_cache.popitem(last=False)
     return result
 
 
@@ -76,6 +102,9 @@ def find_audio_files_recursively(directory: str, max_files=100) -> List[AudioFil
         for root, dirs, files in os.walk(directory):
             # Skip hidden directories
             dirs[:] = [d for d in dirs if not d.startswith('.')]
+
+            # Joined by concatenation, os.path.join per file re-checks every part
+            prefix = root if root.endswith(os.sep) else root + os.sep
             
             # Process files in current directory
             for file in files:
@@ -90,8 +119,7 @@ def find_audio_files_recursively(directory: str, max_files=100) -> List[AudioFil
                     
                 # Check if it's an audio file
                 if is_audio_file(file):
-                    full_path = os.path.join(root, file)
-                    audio_files.append(AudioFile(full_path))
+                    audio_files.append(AudioFile(prefix + file))
                     
                 # Print progress every 10 files
                 if len(audio_files) % 10 == 0 and len(audio_files) > 0:
@@ -2,6 +2,17 @@
 GPIO Pin definitions for Radiowecker project
 """
 
+__all__ = (
+    "I2C_SDA", "I2C_SCL",
+    "I2S_CLK", "I2S_FS", "I2S_DIN", "I2S_DOUT",
+    "AMP_MUTE",
+    "TOUCH_POWER", "TOUCH_SOURCE", "TOUCH_MENU", "TOUCH_BACKWARD", "TOUCH_FORWARD",
+    "ROTARY1_A", "ROTARY1_B", "ROTARY1_SW",
+    "ROTARY2_A", "ROTARY2_B", "ROTARY2_SW",
+    "TOUCH_PINS", "ROTARY1_PINS", "ROTARY2_PINS", "I2C_PINS", "I2S_PINS",
+    "BUTTON_PIN_MAP", "ENCODER_PIN_MAP",
+)
+
 # I2C Pins (Display) - können von mehreren Geräten gleichzeitig genutzt werden
 I2C_SDA = 2
 I2C_SCL = 3
@@ -37,6 +48,19 @@ TOUCH_PINS = [TOUCH_POWER, TOUCH_SOURCE, TOUCH_MENU, TOUCH_BACKWARD, TOUCH_FORWA
 ROTARY1_PINS = [ROTARY1_A, ROTARY1_B, ROTARY1_SW]
 ROTARY2_PINS = [ROTARY2_A, ROTARY2_B, ROTARY2_SW]
 
+# Eingaben nach Namen, wie sie HardwareInput meldet (Reihenfolge = Anzeige-Reihenfolge)
+BUTTON_PIN_MAP = {
+    "power": TOUCH_POWER,
+    "source": TOUCH_SOURCE,
+    "menu": TOUCH_MENU,
+    "alarm1": TOUCH_BACKWARD,
+    "alarm2": TOUCH_FORWARD,
+}
+ENCODER_PIN_MAP = {
+    "volume": ROTARY1_PINS,
+    "control": ROTARY2_PINS,
+}
+
 # Reserved/Used Pins (zur Information)
 I2C_PINS = [I2C_SDA, I2C_SCL]
 I2S_PINS = [I2S_CLK, I2S_FS, I2S_DIN, I2S_DOUT]
@@ -1,28 +1,52 @@
 # hardware.py
 
+import asyncio
 import time
-from typing import Callable, Optional
-import threading
-from gpio_pins import *  # Import GPIO pin definitions
+import mmap
+import numpy as np
+from functools import partial
+from typing import Callable, Dict, Sequence
+from gpio_pins import ROTARY1_A, AMP_MUTE, BUTTON_PIN_MAP, ENCODER_PIN_MAP
 try:
     import RPi.GPIO as GPIO
     RPI_HARDWARE = True
 except ImportError:
     RPI_HARDWARE = False
-    import pygame  # Use pygame for Windows
-    import keyboard  # Keyboard library for PC testing
+    from pygame_manager import PygameManager  # Use pygame for Windows
 
+# BCM283x GPIO register block: GPLEV0 holds the levels of GPIO 0-31
+GPIOMEM_PATH = '/dev/gpiomem'
+GPIOMEM_SIZE = 4096
+GPLEV0_OFFSET = 0x34
 
-class Button:
-    def __init__(self, pin: int, name: str):
-        self.pin = pin
-        self.name = name
-        self.pressed = False
-        self.last_press_time = 0
-        self.DEBOUNCE_TIME = 0.05  # 50ms
+try:
+    import gpiod  # Edge events from the GPIO character device
+    GPIOD_AVAILABLE = True
+except ImportError:
+    GPIOD_AVAILABLE = False
+
+try:
+    import evdev  # Encoders decoded by the kernel rotary-encoder driver
+    EVDEV_AVAILABLE = True
+except ImportError:
+    EVDEV_AVAILABLE = False
+
+# Input devices created by the rotary-encoder overlay (see setup.sh); the
+# node is named after pin_a in hex, e.g. rotary@17 for GPIO 23
+ROTARY_EVDEV_PATHS = {
+    "volume": f"/dev/input/by-path/platform-rotary@{ROTARY1_A:x}-event",
+}
+
+
+BUTTON_DEBOUNCE_TIME = 0.05  # 50ms
 
 
 class RotaryEncoder:
+    __slots__ = ('pin_a', 'pin_b', 'pin_sw', 'name', 'last_state_a', 'last_state_b',
+                 'switch_pressed', 'last_press_time', 'kernel_decoded')
+
+    DEBOUNCE_TIME = 0.05  # 50ms
+
     def __init__(self, pin_a: int, pin_b: int, pin_sw: int, name: str):
         self.pin_a = pin_a
         self.pin_b = pin_b
@@ -32,100 +56,82 @@ class RotaryEncoder:
         self.last_state_b = 0
         self.switch_pressed = False
         self.last_press_time = 0
-        self.DEBOUNCE_TIME = 0.05  # 50ms
-
-
-class PygameManager:
-    _instance = None
-
-    @staticmethod
-    def get_instance():
-        if PygameManager._instance is None:
-            PygameManager._instance = PygameManager()
-        return PygameManager._instance
-
-    def __init__(self):
-        pygame.init()
-        self.button_map = {
-            pygame.K_p: "power",
-            pygame.K_s: "source",
-            pygame.K_m: "menu",
-            pygame.K_LEFT: "alarm1",   # Changed from backward
-            pygame.K_RIGHT: "alarm2",  # Changed from forward
-        }
-        self.running = True
-
-    def process_events(self):
-        for event in pygame.event.get():
-            if event.type == pygame.QUIT:
-                self.running = False
-                return False
-            elif event.type == pygame.KEYDOWN:
-                button_name = self.button_map.get(event.key)
-                if button_name is not None:
-                    return button_name, True
-            elif event.type == pygame.KEYUP:
-                button_name = self.button_map.get(event.key)
-                if button_name is not None:
-                    return button_name, False
-        return None
-
-    def cleanup(self):
-        """Cleanup pygame resources"""
-        pygame.quit()
+        # A/B handled by the kernel rotary-encoder driver, only the switch is read here
+        self.kernel_decoded = False
 
 
 class HardwareInput:
-    def __init__(self, callback: Callable[[str, bool], None]):
+    def __init__(self, callback: Callable[[str, bool], None],
+                 button_pins: Dict[str, int] = BUTTON_PIN_MAP,
+                 encoder_pins: Dict[str, Sequence[int]] = ENCODER_PIN_MAP):
+        """button_pins maps button name -> pin (active high), encoder_pins maps
+        encoder name -> (pin_a, pin_b, pin_sw) (active low)"""
         self.callback = callback
         self.running = True
 
-        # Button definitions
-        self.buttons = {
-            "power": Button(TOUCH_POWER, "Power"),
-            "source": Button(TOUCH_SOURCE, "Source"),
-            "menu": Button(TOUCH_MENU, "Menu"),
-            "alarm1": Button(TOUCH_BACKWARD, "Alarm 1"),  # Renamed from backward
-            "alarm2": Button(TOUCH_FORWARD, "Alarm 2"),   # Renamed from forward
-        }
+        # Button definitions, state kept in parallel arrays indexed by button
+        self.button_names = tuple(button_pins)
+        self.button_pins = np.array(list(button_pins.values()), np.int64)
+        self.button_pressed = np.zeros(len(self.button_names), np.uint8)
+        # Time of the last accepted press, press debounce is measured from it
+        self.button_last_press = np.zeros(len(self.button_names), np.float64)
+        # A release seen within BUTTON_DEBOUNCE_TIME of the press may still be bounce:
+        # time at which it takes effect unless the line goes high again, 0 = none pending
+        self.button_release_at = np.zeros(len(self.button_names), np.float64)
+        self._button_index = {name: i for i, name in enumerate(self.button_names)}
 
         # Rotary Encoder definitions
         self.encoders = {
-            "volume": RotaryEncoder(ROTARY1_A, ROTARY1_B, ROTARY1_SW, "Volume"),
-            "control": RotaryEncoder(ROTARY2_A, ROTARY2_B, ROTARY2_SW, "Control")
+            name: RotaryEncoder(pin_a, pin_b, pin_sw, name.title())
+            for name, (pin_a, pin_b, pin_sw) in encoder_pins.items()
         }
+        # Iterated on every poll tick, built once instead of a dict view per tick
+        self._encoder_scan = tuple(self.encoders.values())
 
         if RPI_HARDWARE:
             # Ensure GPIO mode is set before any GPIO operations
             GPIO.setwarnings(False)  # Disable warnings
             GPIO.setmode(GPIO.BCM)
             self.setup_gpio()
+            # Encoders with a kernel input device, name -> evdev.InputDevice
+            self._rotary_devices = self.open_rotary_devices() if EVDEV_AVAILABLE else {}
+            # Bound once so the polling loop skips the module attribute lookup
+            self._gpio_input = GPIO.input
+            self._input_pins = tuple(self.button_pins.tolist()) + tuple(
+                pin for e in self.encoders.values() for pin in (e.pin_a, e.pin_b, e.pin_sw))
+            # All pin levels in one register read, None if /dev/gpiomem is unavailable
+            self._gpio_mem = None
+            self._gplev0 = None
+            try:
+                self.map_gpio_registers()
+            except OSError as e:
+                print(f"Warning: Could not map {GPIOMEM_PATH}, using GPIO.input: {e}")
+            # Edge-event file descriptors -> handler, empty when polling
+            self._edge_handlers = {}
+            if GPIOD_AVAILABLE:
+                try:
+                    self.setup_gpiod()
+                except Exception as e:
+                    print(f"Warning: Could not request GPIO edge events, polling instead: {e}")
+                    self._edge_handlers = {}
+            # Without the register map, polling reads all lines in one bulk ioctl
+            self._line_bulk = None
+            if GPIOD_AVAILABLE and self._gplev0 is None and not self._edge_handlers:
+                try:
+                    self.setup_line_bulk()
+                except Exception as e:
+                    print(f"Warning: Could not request GPIO lines, using GPIO.input: {e}")
+                    self._line_bulk = None
         else:
-            # Key mappings for PC testing
-            self.key_map = {
-                'p': "power",
-                'm': "menu",
-                's': "source",
-                '1': "alarm1",
-                '2': "alarm2",
-                # Encoder simulation keys
-                'up': "volume_up",
-                'down': "volume_down",
-                'v': "volume_press",
-                'right': "control_right",
-                'left': "control_left",
-                'c': "control_press",
-            }
-
-        # Start input thread
-        self.thread = threading.Thread(target=self.input_loop, daemon=True)
-        self.thread.start()
+            # PC testing: key events from the pygame window, pumped by the main loop
+            self.pygame = PygameManager.get_instance()
+            self.pygame.subscribe(self.handle_key)
 
     def setup_gpio(self):
         """Setup GPIO pins for buttons and encoders"""
         # Setup touch buttons with pull-down (active high)
-        for button in self.buttons.values():
-            GPIO.setup(button.pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
+        for pin in self.button_pins.tolist():
+            GPIO.setup(pin, GPIO.IN, pull_up_down=GPIO.PUD_DOWN)
         
         # Setup encoders with pull-up (active low)
         for encoder in self.encoders.values():
@@ -133,41 +139,156 @@ class HardwareInput:
             GPIO.setup(encoder.pin_b, GPIO.IN, pull_up_down=GPIO.PUD_UP)
             GPIO.setup(encoder.pin_sw, GPIO.IN, pull_up_down=GPIO.PUD_UP)
 
-    def process_button(self, button_name: str, button: Button, state: bool):
-        """Simplified button processing - only handle press with debounce"""
-        current_time = time.time()
-        
-        if state and not button.pressed:
-            if current_time - button.last_press_time >= button.DEBOUNCE_TIME:
-                button.pressed = True
-                button.last_press_time = current_time
-                self.callback(button_name, True)
-        elif not state and button.pressed:
-            button.pressed = False
-
-    def process_encoder(self, encoder: RotaryEncoder):
-        """Process rotary encoder state"""
+    def map_gpio_registers(self):
+        """Map the GPIO register page so GPLEV0 can be read directly"""
+        with open(GPIOMEM_PATH, 'r+b') as f:
+            self._gpio_mem = mmap.mmap(f.fileno(), GPIOMEM_SIZE)
+        self._gplev0 = memoryview(self._gpio_mem)[GPLEV0_OFFSET:GPLEV0_OFFSET + 4].cast('I')
+
+    def read_levels(self) -> int:
+        """Snapshot of all input pin levels as a bit mask (bit n = GPIO n)"""
+        if self._gplev0 is not None:
+            return self._gplev0[0]
+        levels = 0
+        if self._line_bulk is not None:
+            for pin, value in zip(self._bulk_pins, self._line_bulk.get_values()):
+                if value:
+                    levels |= 1 << pin
+            return levels
+        gpio_input = self._gpio_input
+        for pin in self._input_pins:
+            if gpio_input(pin):
+                levels |= 1 << pin
+        return levels
+
+    def open_rotary_devices(self) -> dict:
+        """Open the kernel input devices of encoders bound to the rotary-encoder overlay"""
+        devices = {}
+        for name, path in ROTARY_EVDEV_PATHS.items():
+            try:
+                devices[name] = evdev.InputDevice(path)
+            except OSError:
+                continue
+            self.encoders[name].kernel_decoded = True
+        return devices
+
+    def setup_gpiod(self):
+        """Request both-edge events for all input pins from /dev/gpiochip0,
+        with the same pull-downs (buttons) and pull-ups (encoders) as setup_gpio"""
+        self._gpio_chip = gpiod.Chip('gpiochip0')
+
+        for index, pin in enumerate(self.button_pins.tolist()):
+            line = self._request_edges(pin, gpiod.LINE_REQ_FLAG_BIAS_PULL_DOWN)
+            self._edge_handlers[line.event_get_fd()] = partial(
+                self._on_button_edge, line, index)
+
+        for encoder in self.encoders.values():
+            # Lines owned by the rotary-encoder driver cannot be requested
+            pins = ((encoder.pin_sw,) if encoder.kernel_decoded
+                    else (encoder.pin_a, encoder.pin_b, encoder.pin_sw))
+            for pin in pins:
+                line = self._request_edges(pin, gpiod.LINE_REQ_FLAG_BIAS_PULL_UP)
+                self._edge_handlers[line.event_get_fd()] = partial(
+                    self._on_encoder_edge, line, encoder)
+
+    def user_input_pins(self) -> tuple:
+        """Input pins we can claim, i.e. all except those owned by the rotary-encoder driver"""
+        pins = tuple(self.button_pins.tolist())
+        for encoder in self.encoders.values():
+            if not encoder.kernel_decoded:
+                pins += (encoder.pin_a, encoder.pin_b)
+            pins += (encoder.pin_sw,)
+        return pins
+
+    def setup_line_bulk(self):
+        """Request all polled input lines as one bulk so read_levels needs a single ioctl.
+        Bias is left as configured by setup_gpio."""
+        self._bulk_pins = self.user_input_pins()
+        self._gpio_chip = gpiod.Chip('gpiochip0')
+        self._line_bulk = self._gpio_chip.get_lines(list(self._bulk_pins))
+        self._line_bulk.request(consumer='radiowecker', type=gpiod.LINE_REQ_DIR_IN)
+
+    def _request_edges(self, pin: int, bias_flag: int):
+        line = self._gpio_chip.get_line(pin)
+        line.request(consumer='radiowecker', type=gpiod.LINE_REQ_EV_BOTH_EDGES, flags=bias_flag)
+        return line
+
+    def _on_button_edge(self, line, index: int):
+        event = line.event_read()
+        # Take the line's current level rather than the edge type, so a bounced
+        # edge can't leave the stored state inverted. Debounce against the
+        # kernel's edge timestamp (CLOCK_MONOTONIC), not the time we got scheduled
+        self.process_button(index, line.get_value(), event.sec + event.nsec / 1e9)
+
+    def _on_encoder_edge(self, line, encoder: RotaryEncoder):
+        line.event_read()
+        self.process_encoder(encoder, self.read_levels(), time.monotonic())
+
+    def process_button(self, index: int, state: bool, now: float):
+        """Simplified button processing - only report presses. A press within
+        BUTTON_DEBOUNCE_TIME of the last accepted press is bounce. A release within
+        that window is kept pending and only takes effect at its end, if the line
+        hasn't gone high again by then; releases are never dropped, since edge-driven
+        input would not look at the button again.
+        now is a time.monotonic() timestamp, taken once per sweep by the caller."""
+        self.confirm_releases(now)
+        if state:
+            # Back high: a pending release was bounce, the press goes on
+            self.button_release_at[index] = 0
+            if self.button_pressed[index]:
+                return
+            if now - self.button_last_press[index] < BUTTON_DEBOUNCE_TIME:
+                return
+            self.button_last_press[index] = now
+            self.button_pressed[index] = 1
+            self.callback(self.button_names[index], True)
+        elif self.button_pressed[index] and not self.button_release_at[index]:
+            due = self.button_last_press[index] + BUTTON_DEBOUNCE_TIME
+            if now >= due:
+                self.button_pressed[index] = 0
+                return
+            self.button_release_at[index] = due
+            try:
+                # Edge sources may not report anything else, confirm it ourselves
+                loop = asyncio.get_running_loop()
+            except RuntimeError:
+                return  # Confirmed by the next call instead
+            loop.call_later(max(0.0, due - time.monotonic()),
+                            lambda: self.confirm_releases(time.monotonic()))
+
+    def confirm_releases(self, now: float):
+        """Apply pending releases whose debounce window is over"""
+        due = np.flatnonzero(self.button_release_at)
+        if due.size:
+            due = due[self.button_release_at[due] <= now]
+            self.button_pressed[due] = 0
+            self.button_release_at[due] = 0
+
+    def is_any_pressed(self) -> bool:
+        return bool(self.button_pressed.any())
+
+    def process_encoder(self, encoder: RotaryEncoder, levels: int, now: float):
+        """Process rotary encoder state from a read_levels() snapshot taken at now"""
         if not RPI_HARDWARE:
             return
             
         # Read current states (inverted because of pull-up)
-        state_a = not GPIO.input(encoder.pin_a)
-        state_b = not GPIO.input(encoder.pin_b)
-        state_sw = not GPIO.input(encoder.pin_sw)
+        state_a = not (levels >> encoder.pin_a) & 1
+        state_b = not (levels >> encoder.pin_b) & 1
+        state_sw = not (levels >> encoder.pin_sw) & 1
         
         # Process rotary movement
-        if state_a != encoder.last_state_a:
+        if not encoder.kernel_decoded and state_a != encoder.last_state_a:
             if state_a != state_b:
                 self.callback(f"{encoder.name.lower()}_ccw", True)  # Counter-clockwise
             else:
                 self.callback(f"{encoder.name.lower()}_cw", True)   # Clockwise
         
         # Process switch with debounce
-        current_time = time.time()
         if state_sw and not encoder.switch_pressed:
-            if current_time - encoder.last_press_time >= encoder.DEBOUNCE_TIME:
+            if now - encoder.last_press_time >= encoder.DEBOUNCE_TIME:
                 encoder.switch_pressed = True
-                encoder.last_press_time = current_time
+                encoder.last_press_time = now
                 self.callback(f"{encoder.name.lower()}_press", True)
         elif not state_sw and encoder.switch_pressed:
             encoder.switch_pressed = False
@@ -178,41 +299,107 @@ class HardwareInput:
 
     def check_gpio_buttons(self):
         """Check physical button and encoder states"""
-        # Check touch buttons
-        for name, button in self.buttons.items():
-            state = GPIO.input(button.pin)  # Active high for touch buttons
-            self.process_button(name, button, state)
+        levels = self.read_levels()
+        now = time.monotonic()
+
+        # Check touch buttons, active high; only those whose level changed or
+        # with a release pending, so a bounce back high cancels it
+        states = (levels >> self.button_pins) & 1
+        for index in np.flatnonzero((states != self.button_pressed) | (self.button_release_at > 0)):
+            self.process_button(index, states[index], now)
         
         # Check encoders
-        for encoder in self.encoders.values():
-            self.process_encoder(encoder)
+        for encoder in self._encoder_scan:
+            self.process_encoder(encoder, levels, now)
 
-    def check_keyboard(self):
-        """Check keyboard input for PC testing"""
-        for key, action in self.key_map.items():
-            try:
-                if keyboard.is_pressed(key):
-                    if action in self.buttons:
-                        self.process_button(action, self.buttons[action], True)
-                    else:
-                        # Simulate encoder actions directly
-                        self.callback(action, True)
-            except:
-                pass
-
-    def input_loop(self):
-        """Main input processing loop"""
-        while self.running:
-            if RPI_HARDWARE:
-                self.check_gpio_buttons()
+    def handle_key(self, action: str, state: bool):
+        """PygameManager subscriber: keys stand in for buttons and encoders (PC testing)"""
+        index = self._button_index.get(action)
+        if index is not None:
+            self.process_button(index, state, time.monotonic())
+        elif state:
+            # Simulate encoder actions directly
+            self.callback(action, True)
+
+    async def run(self):
+        """Input processing task, runs on the application's event loop until cancelled"""
+        if not RPI_HARDWARE:
+            return  # PC input arrives through handle_key
+
+        rotary_tasks = [asyncio.create_task(self.read_rotary_device(self.encoders[name], device))
+                        for name, device in self._rotary_devices.items()]
+        try:
+            if self._edge_handlers:
+                await self.wait_for_edges()
             else:
-                self.check_keyboard()
-            time.sleep(0.001)  # ~30 Hz polling rate
+                try:
+                    await self.wait_for_gpio_callbacks()
+                except RuntimeError as e:
+                    # add_event_detect fails on kernels without the sysfs GPIO interface
+                    print(f"Warning: GPIO edge detection unavailable, polling instead: {e}")
+                    await self.poll_inputs()
+        finally:
+            for task in rotary_tasks:
+                task.cancel()
+
+    async def wait_for_edges(self):
+        """Edge events: the event loop's epoll wakes us per GPIO change"""
+        loop = asyncio.get_running_loop()
+        for fd, handler in self._edge_handlers.items():
+            loop.add_reader(fd, handler)
+        try:
+            await loop.create_future()
+        finally:
+            for fd in self._edge_handlers:
+                loop.remove_reader(fd)
+
+    async def wait_for_gpio_callbacks(self):
+        """Edge detection through RPi.GPIO: its callback thread hands every edge to
+        the event loop, which re-reads all inputs"""
+        loop = asyncio.get_running_loop()
+
+        def on_edge(pin):
+            loop.call_soon_threadsafe(self.check_gpio_buttons)
+
+        pins = self.user_input_pins()
+        try:
+            for pin in pins:
+                GPIO.add_event_detect(pin, GPIO.BOTH, callback=on_edge)
+            await loop.create_future()
+        finally:
+            for pin in pins:
+                GPIO.remove_event_detect(pin)
+
+    async def poll_inputs(self):
+        while self.running:
+            self.check_gpio_buttons()
+            await asyncio.sleep(0.001)  # ~30 Hz polling rate
+
+    async def read_rotary_device(self, encoder: RotaryEncoder, device):
+        """Turn relative-axis events of a kernel-decoded encoder into cw/ccw callbacks"""
+        prefix = encoder.name.lower()
+        async for event in device.async_read_loop():
+            if event.type != evdev.ecodes.EV_REL or not event.value:
+                continue
+            action = f"{prefix}_cw" if event.value > 0 else f"{prefix}_ccw"
+            for _ in range(abs(event.value)):
+                self.callback(action, True)
 
     def cleanup(self):
         """Cleanup GPIO and other resources"""
         self.running = False
         if RPI_HARDWARE:
+            for device in self._rotary_devices.values():
+                device.close()
+            if self._line_bulk is not None:
+                self._line_bulk.release()
+                self._line_bulk = None
+            if self._gplev0 is not None:
+                self._gplev0.release()
+                self._gplev0 = None
+            if self._gpio_mem is not None:
+                self._gpio_mem.close()
+                self._gpio_mem = None
             GPIO.cleanup()
 
 
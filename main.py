@@ -1,26 +1,31 @@
 # main.py
 
-import sys
 import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 from display import Display, PygameDisplay, OLEDDisplay
 from audio import AudioManager
 from settings import Settings
-from ui import UI
+from ui import UI, UIMode
 import subprocess
 from hardware import HardwareInput, HardwareOutput, RPI_HARDWARE
-
-try:
-    import pygame  # Use pygame for Windows
-    RPI_HARDWARE = False
-except ImportError:
-    RPI_HARDWARE = True
+if not RPI_HARDWARE:
+    from pygame_manager import PygameManager  # Use pygame for Windows
 import signal
 
 class RadioWecker:
     def __init__(self):
         self.running = True
+        # Set by input callbacks so the main loop renders without waiting out the frame
+        self._wake = asyncio.Event()
+        # Last applied display settings, None when they need to be re-read
+        self._display_cache = None
+        # Epoch time of the next alarm minute, None when it needs to be recomputed
+        self._next_alarm = None
+        # Start of the minute after the last alarm that was due, so it isn't due twice
+        self._alarm_done_until = 0
 
         # Determine if running on Pi or PC
         self.is_pi = RPI_HARDWARE
@@ -36,12 +41,16 @@ class RadioWecker:
     def init_components(self):
         """Initialize all system components"""
         try:
-            # Connect to WiFi if on Pi
+            # WiFi and the audio backend (VLC plugin scan, directory scans) are slow
+            # and independent of the display, so they start in the background
+            pool = ThreadPoolExecutor(max_workers=2)
             if self.is_pi:
                 # Replace with your WiFi credentials
-                self.connect_wifi("raspberrypi", "raspberry")
+                pool.submit(self.connect_wifi, "raspberrypi", "raspberry")
+            audio_future = pool.submit(AudioManager)
+            pool.shutdown(wait=False)
 
-            # Create display
+            # Create display (pygame has to be set up on the main thread)
             if self.is_pi:
                 self.display = OLEDDisplay(128, 64)
             else:
@@ -49,7 +58,7 @@ class RadioWecker:
 
             # Create other components
             self.settings = Settings()
-            self.audio = AudioManager()
+            self.audio = audio_future.result()
             self.hardware_out = HardwareOutput()
             self.ui = UI(self.display, self.settings, self.audio, self.hardware_out)
 
@@ -61,7 +70,7 @@ class RadioWecker:
 
             # Setup hardware input with UI callback
             try:
-                self.hardware_in = HardwareInput(self.ui.handle_button)
+                self.hardware_in = HardwareInput(self.handle_input)
                 # Connect hardware input to UI for button state monitoring
                 self.ui.set_hardware_input(self.hardware_in)
             except Exception as e:
@@ -75,14 +84,31 @@ class RadioWecker:
             raise
 
     def apply_settings(self):
-        """Apply current settings to hardware"""
-        display_settings = self.settings.get_display_settings()
+        """Apply current settings to hardware, if they changed since the last call"""
+        if self._display_cache is not None:
+            return
+        self._display_cache = display_settings = self.settings.get_display_settings()
 
         # Set display brightness
         # self.hardware_out.set_display_brightness(display_settings["brightness"])
 
     def check_alarms(self):
         """Check and handle alarms"""
+        now = time.time()
+        # Clock set back (e.g. NTP after boot): before the minute of the alarm that
+        # was last due, or with the next alarm more than a day ahead
+        if now < self._alarm_done_until - 60:
+            self._alarm_done_until = 0
+            self._next_alarm = None
+        elif self._next_alarm is not None and self._next_alarm - now > 86400:
+            self._next_alarm = None
+        if self._next_alarm is None:
+            self._next_alarm = self.settings.next_alarm_time(max(now, self._alarm_done_until))
+        if now < self._next_alarm:
+            return
+        self._alarm_done_until = int(now) // 60 * 60 + 60
+        self._next_alarm = self.settings.next_alarm_time(self._alarm_done_until)
+
         alarm = self.settings.check_alarms()
         if alarm > 0 and not self.audio.is_playing():
             # Wake from standby
@@ -95,45 +121,111 @@ class RadioWecker:
 
             # Update UI alarm indicator
             self.ui.state.alarm_mode |= alarm
+            self.ui.state.dirty = True
 
     def update_status(self):
         """Update various status information"""
         # Update playing status
-        self.ui.state.is_playing = self.audio.is_playing()
+        is_playing = self.audio.is_playing()
+        if is_playing != self.ui.state.is_playing:
+            self.ui.state.is_playing = is_playing
+            self.ui.state.dirty = True
 
         # Force update Bluetooth info if we're on the Bluetooth source
         if self.ui.state.get_current_source() == "BLUETOOTH":
             self.audio.get_bluetooth_info(force_update=True)
+            self.ui.state.dirty = True
+
+        # The status page of the menu shows the live CPU temperature
+        if self.ui.state.mode == UIMode.MENU:
+            self.ui.state.dirty = True
 
         # Enable/disable amp based on playing state
         # self.hardware_out.set_amp_enable(self.ui.state.is_playing)
 
-    def main_loop(self):
+    def handle_input(self, button: str, pressed: bool):
+        """Forward input to the UI and wake the main loop"""
+        # Settings can only change from the menu
+        if self.ui.state.mode == UIMode.MENU:
+            self._display_cache = None
+            self._next_alarm = None
+        self.ui.handle_button(button, pressed)
+        self._wake.set()
+
+    async def main_loop(self):
         """Main application loop"""
         print("Main application loop")
+        frame_interval = 0.033
+        update_interval = 1
         last_time = time.time()
+        last_frame_time = 0
+        last_held = False
+        last_minute = None
 
-        while self.running:
-            current_time = time.time()
-            if current_time - last_time >= 1:
-                self.check_alarms()
-                self.update_status()
-                last_time = current_time
+        # Input handling runs as a task on this loop instead of its own thread
+        input_task = None
+        if self.hardware_in:
+            input_task = asyncio.create_task(self.hardware_in.run())
 
-            # Process any pending audio commands
-            self.audio.process_commands()
-
-            # Update display
-            self.ui.render()
-            self.display.show()
-
-            # Small sleep to prevent busy waiting
-            time.sleep(0.033)
+        try:
+            while self.running:
+                # PC testing: keyboard input arrives as pygame events
+                if not self.is_pi and not PygameManager.get_instance().process_events():
+                    self.running = False
+                    break
+
+                current_time = time.time()
+                if current_time - last_time >= update_interval:
+                    self.check_alarms()
+                    self.update_status()
+                    self.apply_settings()
+                    last_time = current_time
+                    # The clock only shows minutes; UTC offsets are whole minutes,
+                    # so the epoch minute flips with the local one (as in UI.clock_text)
+                    minute = int(current_time) // 60
+                    if minute != last_minute:
+                        self.ui.state.dirty = True
+                        last_minute = minute
+
+                # Button releases and an expiring volume overlay don't go through handle_button
+                if self.hardware_in:
+                    held = self.hardware_in.is_any_pressed()
+                    if held != last_held:
+                        self.ui.state.dirty = True
+                        last_held = held
+                if self.ui.state.volume_overlay_timeout and current_time >= self.ui.state.volume_overlay_timeout:
+                    self.ui.state.volume_overlay_timeout = 0
+                    self.ui.state.dirty = True
+
+                # Process any pending audio commands
+                if self.audio.cmd_event.is_set():
+                    self.audio.process_commands()
+
+                # Redraw only when something visible changed: right away if input
+                # woke us, otherwise at most once per frame
+                woken = self._wake.is_set()
+                self._wake.clear()
+                if self.ui.state.dirty and (woken or current_time - last_frame_time >= frame_interval):
+                    self.ui.render()
+                    self.ui.state.dirty = False
+                    last_frame_time = current_time
+
+                # Sleep until the next deadline unless input arrives first
+                next_deadline = min(current_time + frame_interval,
+                                    last_time + update_interval)
+                try:
+                    await asyncio.wait_for(self._wake.wait(),
+                                           max(0, next_deadline - time.time()))
+                except asyncio.TimeoutError:
+                    pass
+        finally:
+            if input_task:
+                input_task.cancel()
 
     def cleanup(self):
         """Cleanup on exit"""
         self.running = False
-        if hasattr(self, 'hardware_in'):
+        if getattr(self, 'hardware_in', None):
             self.hardware_in.cleanup()
         self.hardware_out.cleanup()
         self.audio.stop()
@@ -149,9 +241,9 @@ class RadioWecker:
                 print(f"Error resetting pulseaudio: {e}")
 
     def signal_handler(self, signum, frame):
-        """Handle system signals"""
-        self.cleanup()
-        sys.exit(0)
+        """Handle system signals: let main_loop return, main() cleans up"""
+        self.running = False
+        self._wake.set()
 
     def connect_wifi(self, ssid: str, password: str) -> bool:
         """Connect to a WiFi network using nmcli."""
@@ -173,7 +265,7 @@ def main():
     app = RadioWecker()
 
     try:
-        app.main_loop()
+        asyncio.run(app.main_loop())
     except Exception as e:
         print(f"Error: {e}")
     finally:
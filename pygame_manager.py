@@ -1,5 +1,7 @@
 # pygame_manager.py
 
+from typing import Callable
+
 try:
     import pygame
 except ImportError:
@@ -7,20 +9,64 @@ except ImportError:
 
 class PygameManager:
     _instance = None
-    
+
     @classmethod
     def get_instance(cls):
         if cls._instance is None:
             cls._instance = PygameManager()
         return cls._instance
-    
+
     def __init__(self):
-        if not pygame.get_init():
-            pygame.init()
+        # Only the window and keyboard are used, audio goes through VLC
+        if not pygame.display.get_init():
+            pygame.display.init()
+        # Held keys should behave like a physical button: one KEYDOWN, one KEYUP
+        pygame.key.set_repeat(0)
+        # Only queue what process_events handles, mouse motion etc. is dropped by SDL
+        pygame.event.set_blocked(None)
+        pygame.event.set_allowed([pygame.QUIT, pygame.KEYDOWN, pygame.KEYUP])
         self.screen = None
-        
+        self.button_map = {
+            pygame.K_p: "power",
+            pygame.K_s: "source",
+            pygame.K_m: "menu",
+            pygame.K_1: "alarm1",
+            pygame.K_2: "alarm2",
+            # Encoder simulation keys
+            pygame.K_UP: "volume_cw",
+            pygame.K_DOWN: "volume_ccw",
+            pygame.K_v: "volume_press",
+            pygame.K_RIGHT: "control_cw",
+            pygame.K_LEFT: "control_ccw",
+            pygame.K_c: "control_press",
+        }
+        self.running = True
+        # Called with (button_name, pressed) for every mapped key event
+        self._subscribers: list[Callable[[str, bool], None]] = []
+
     def set_screen(self, screen):
         self.screen = screen
-        
+
     def get_screen(self):
         return self.screen
+
+    def subscribe(self, fn: Callable[[str, bool], None]):
+        self._subscribers.append(fn)
+
+    def process_events(self) -> bool:
+        """Drain the pygame event queue, the only place that does so, and pass
+        key events to all subscribers. Returns False once the window has been closed."""
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
+                self.running = False
+            elif event.type == pygame.KEYDOWN or event.type == pygame.KEYUP:
+                button_name = self.button_map.get(event.key)
+                if button_name is not None:
+                    pressed = event.type == pygame.KEYDOWN
+                    for fn in self._subscribers:
+                        fn(button_name, pressed)
+        return self.running
+
+    def cleanup(self):
+        """Cleanup pygame resources"""
+        pygame.quit()
@@ -3,13 +3,21 @@
 import json
 import os
 import subprocess
-from datetime import datetime
+import tempfile
+import threading
+import zlib
+from datetime import datetime, timedelta, timezone
 from typing import Any, Dict, List
-from dataclasses import dataclass
-from time import localtime
+from dataclasses import dataclass, field
+from time import localtime, monotonic
+from functools import lru_cache
 
 
-@dataclass
+# "00".."59", time values are only ever hours or minutes
+_TWO_DIGIT = tuple(f"{i:02d}" for i in range(60))
+
+
+@dataclass(slots=True)
 class MenuItem:
     name: str
     value_type: str  # "int", "time", "bool", "status"
@@ -18,12 +26,18 @@ class MenuItem:
     max_val: int = None
     step: int = 1
     unit: str = ""
+    # Wrap-around for time values (hours or minutes), set in __post_init__
+    _mod: int = field(default=None, init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        if self.value_type == "time":
+            self._mod = 60 if self.max_val == 59 else 24
 
     def increase(self):
         if self.value_type == "int":
             self.value = min(self.max_val, self.value + self.step)
         elif self.value_type == "time":
-            self.value = (self.value + 1) % (60 if self.max_val == 59 else 24)
+            self.value = (self.value + 1) % self._mod
         elif self.value_type == "bool":
             self.value = not self.value
 
@@ -31,18 +45,18 @@ class MenuItem:
         if self.value_type == "int":
             self.value = max(self.min_val, self.value - self.step)
         elif self.value_type == "time":
-            self.value = (self.value - 1) % (60 if self.max_val == 59 else 24)
+            self.value = (self.value - 1) % self._mod
         elif self.value_type == "bool":
             self.value = not self.value
 
     def format_value(self) -> List[str]:
         """Format value for display, returns list of lines"""
         if self.value_type == "time":
-            return [f"{self.value:02d}"]
+            return [_TWO_DIGIT[self.value]]
         elif self.value_type == "bool":
             return ["AN" if self.value else "AUS"]
         elif self.value_type == "status":
-            return self.value.split("\n")
+            return self.value if isinstance(self.value, list) else self.value.split("\n")
         return [f"{self.value}{self.unit}"]
 
 
@@ -60,10 +74,17 @@ class Settings:
             MenuItem("Status Info", "status", ""),  # Status menu item
         ]
 
+        # Names are unique, lookups by name go through this index
+        self._by_name: Dict[str, MenuItem] = {item.name: item for item in self.items}
+
         self.current_item = 0
         self.config_file = "settings.json"
         self.load_settings()
 
+        # Fill the get_git_info cache off the main thread, so opening the status
+        # page doesn't wait for git
+        threading.Thread(target=get_git_info, daemon=True).start()
+
     def next_item(self) -> bool:
         """Move to next menu item. Returns True if moved, False if at last item"""
         if self.current_item < len(self.items) - 1:
@@ -84,7 +105,9 @@ class Settings:
 
     def prev_item(self):
         """Move to previous menu item"""
-        self.current_item = (self.current_item - 1) % len(self.items)
+        self.current_item -= 1
+        if self.current_item < 0:
+            self.current_item = len(self.items) - 1
 
     def get_current_item(self) -> MenuItem:
         """Get currently selected menu item"""
@@ -94,37 +117,54 @@ class Settings:
         if item.value_type == "status":
             git_info = get_git_info()
             cpu_temp = get_cpu_temp()
-            item.value = f"{git_info}\n{cpu_temp}"
+            # Kept as display lines, format_value returns them as they are
+            item.value = [git_info, cpu_temp]
             
         return item
 
+    def _persisted_values(self) -> Dict[str, Any]:
+        """Values written to the config file, the status text is regenerated"""
+        return {item.name: item.value for item in self.items if item.value_type != "status"}
+
     def load_settings(self):
         """Load settings from JSON file"""
+        # Contents of the file on disk, None if there is none (or it is unreadable),
+        # so the first save writes a complete file
+        self._saved = None
         try:
             if os.path.exists(self.config_file):
                 with open(self.config_file, "r") as f:
                     data = json.load(f)
-                    for item in self.items:
-                        if item.name in data:
-                            item.value = data[item.name]
+                for name, value in data.items():
+                    item = self._by_name.get(name)
+                    if item is not None:
+                        item.value = value
+                self._saved = data
         except Exception as e:
             print(f"Error loading settings: {e}")
 
     def save_settings(self):
-        """Save settings to JSON file"""
+        """Save settings to JSON file, unless nothing changed since load or last save"""
+        data = self._persisted_values()
+        if data == self._saved:
+            return
         try:
-            data = {item.name: item.value for item in self.items}
-            with open(self.config_file, "w") as f:
+            # Write a temp file and rename it over the old one, so a power cut
+            # mid-write leaves either the old or the new settings
+            tmp_file = self.config_file + ".tmp"
+            with open(tmp_file, "w") as f:
                 json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.config_file)
+            self._saved = data
         except Exception as e:
             print(f"Error saving settings: {e}")
 
     def get_value(self, name: str) -> Any:
         """Get value of a setting by name"""
-        for item in self.items:
-            if item.name == name:
-                return item.value
-        return None
+        item = self._by_name.get(name)
+        return item.value if item is not None else None
 
     def check_alarms(self) -> int:
         """Check if any alarm should trigger
@@ -146,6 +186,19 @@ class Settings:
 
         return 0
 
+    def next_alarm_time(self, now: float) -> float:
+        """Epoch time at which the next alarm minute starts. An alarm whose minute is
+        the current one is still due, so starting up within it doesn't skip it"""
+        current = datetime.fromtimestamp(now).replace(second=0, microsecond=0)
+        times = []
+        for prefix in ("Wecker1", "Wecker2"):
+            alarm = current.replace(hour=self.get_value(f"{prefix} Stunden"),
+                                    minute=self.get_value(f"{prefix} Minuten"))
+            if alarm < current:
+                alarm += timedelta(days=1)
+            times.append(alarm.timestamp())
+        return min(times)
+
     def get_display_settings(self) -> Dict[str, int]:
         """Get display-related settings"""
         return {
@@ -159,27 +212,113 @@ class Settings:
         self.current_item = 0
 
 
+GIT_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), ".git")
+# Result of the git fallback, keyed on the HEAD commit, reused across restarts
+GIT_INFO_CACHE = os.path.join(tempfile.gettempdir(), ".radiowecker_git_info")
+
+
+def _read_head_commit(git_dir: str) -> str:
+    """Full hash of HEAD, resolved through the ref files"""
+    with open(os.path.join(git_dir, "HEAD")) as f:
+        head = f.read().strip()
+    if not head.startswith("ref: "):
+        return head  # Detached HEAD
+    ref = head[5:]
+    try:
+        with open(os.path.join(git_dir, ref)) as f:
+            return f.read().strip()
+    except FileNotFoundError:
+        # Ref was packed by git gc / clone
+        with open(os.path.join(git_dir, "packed-refs")) as f:
+            for line in f:
+                sha, _, name = line.rstrip("\n").partition(" ")
+                if name == ref:
+                    return sha
+    raise ValueError(f"{ref} not found")
+
+
+def _git_info_from_files(git_dir: str) -> str:
+    """get_git_info without starting git. Raises OSError (e.g. the commit is only
+    in a pack file), ValueError or zlib.error when the files can't be used"""
+    sha = _read_head_commit(git_dir)
+    with open(os.path.join(git_dir, "objects", sha[:2], sha[2:]), "rb") as f:
+        commit = zlib.decompress(f.read())
+    for line in commit.split(b"\n"):
+        if not line:
+            break  # End of the header, no committer line
+        if line.startswith(b"committer "):
+            # committer Name <mail> 1700000000 +0100, shown in the committer's zone like %cd
+            timestamp, tz = line.rsplit(b" ", 2)[1:]
+            offset = int(tz[1:3]) * 60 + int(tz[3:5])
+            zone = timezone(timedelta(minutes=-offset if tz[:1] == b"-" else offset))
+            last_change = datetime.fromtimestamp(int(timestamp), zone).strftime("%d.%m.%y")
+            return f"Ver: {last_change}, {sha[:7]}"
+    raise ValueError("commit has no committer")
+
+
+@lru_cache(maxsize=1)
 def get_git_info():
+    """Version line for the status page; the checkout doesn't change while we run"""
     try:
-        # Get last commit hash
-        hash_cmd = subprocess.run(['git', 'rev-parse', '--short', 'HEAD'], 
-                                capture_output=True, text=True)
-        commit_hash = hash_cmd.stdout.strip() if hash_cmd.returncode == 0 else "N/A"
-        
-        # Get last modified date
-        date_cmd = subprocess.run(['git', 'log', '-1', '--format=%cd', '--date=format:%d.%m.%y'],
-                                capture_output=True, text=True)
-        last_change = date_cmd.stdout.strip() if date_cmd.returncode == 0 else "N/A"
-        
-        return f"Ver: {last_change}, {commit_hash}"
-    except:
+        return _git_info_from_files(GIT_DIR)
+    except (OSError, ValueError, zlib.error):
+        pass
+
+    # Commit is packed: an earlier run may already have asked git about it
+    try:
+        head = _read_head_commit(GIT_DIR)
+    except (OSError, ValueError):
+        head = None
+    if head:
+        try:
+            with open(GIT_INFO_CACHE, "r") as f:
+                cached = json.load(f)
+            if cached.get("commit") == head:
+                return cached["info"]
+        except (OSError, ValueError, KeyError, AttributeError):
+            pass
+
+    try:
+        # Short hash and commit date in one git call
+        log_cmd = subprocess.run(['git', 'log', '-1', '--format=%h %cd', '--date=format:%d.%m.%y'],
+                                 capture_output=True, text=True, cwd=os.path.dirname(GIT_DIR))
+        if log_cmd.returncode != 0:
+            return "Ver: N/A, N/A"
+        commit_hash, last_change = log_cmd.stdout.split()
+        info = f"Ver: {last_change}, {commit_hash}"
+    except (OSError, ValueError):
         return "Ver: N/A"
 
+    if head:
+        try:
+            with open(GIT_INFO_CACHE, "w") as f:
+                json.dump({"commit": head, "info": info}, f)
+        except OSError:
+            pass
+    return info
+
+CPU_TEMP_TTL = 5  # seconds
+CPU_TEMP_PATH = '/sys/class/thermal/thermal_zone0/temp'
+_cpu_temp_cache = (0.0, "")
+_cpu_temp_file = None  # kept open, sysfs returns a fresh value after seek(0)
+
 def get_cpu_temp():
+    """CPU temperature for the status page, re-read at most every CPU_TEMP_TTL seconds"""
+    global _cpu_temp_cache, _cpu_temp_file
+    now = monotonic()
+    if now - _cpu_temp_cache[0] < CPU_TEMP_TTL:
+        return _cpu_temp_cache[1]
     try:
         # For Raspberry Pi
-        with open('/sys/class/thermal/thermal_zone0/temp', 'r') as f:
-            temp = float(f.read().strip()) / 1000
-        return f"Temp: {temp:.1f}°C"
-    except:
-        return "Temp: N/A"
+        if _cpu_temp_file is None:
+            _cpu_temp_file = open(CPU_TEMP_PATH, 'r')
+        _cpu_temp_file.seek(0)
+        # Millidegrees, rounded to tenths in integer arithmetic
+        tenths = (int(_cpu_temp_file.read()) + 50) // 100
+        sign = "-" if tenths < 0 else ""
+        whole, frac = divmod(abs(tenths), 10)
+        result = f"Temp: {sign}{whole}.{frac}°C"
+    except (OSError, ValueError):
+        result = "Temp: N/A"
+    _cpu_temp_cache = (now, result)
+    return result
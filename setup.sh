@@ -33,7 +33,7 @@ sudo apt-get update
 echo "Installing required packages..."
 sudo apt-get install -y git python3 python3-pip python3-venv \
     python3-rpi.gpio python3-luma.core python3-luma.oled \
-    python3-alsaaudio python3-vlc python3-numpy \
+    python3-alsaaudio python3-vlc python3-numpy python3-libgpiod python3-evdev \
     libopenblas0-pthread liblapack3 libasound2-plugins \
     vlc pulseaudio bluetooth bluez bluez-tools bluez-alsa-utils \
     pulseaudio-module-bluetooth network-manager i2c-tools python3-pil
@@ -84,6 +84,9 @@ ensure_line_in_file "dtoverlay=iqaudio-dacplus" "$CONFIG_FILE"
 ensure_line_in_file "dtparam=audio=on" "$CONFIG_FILE"
 ensure_line_in_file "dtparam=i2c_arm=on" "$CONFIG_FILE"
 ensure_line_in_file "dtparam=i2c_arm_baudrate=400000" "$CONFIG_FILE"
+# Volume encoder (ROTARY1_A/B = GPIO 23/24) decoded by the kernel rotary-encoder
+# driver; shows up as /dev/input/by-path/platform-rotary@17-event (see hardware.py)
+ensure_line_in_file "dtoverlay=rotary-encoder,pin_a=23,pin_b=24,relative_axis=1,steps-per-period=2" "$CONFIG_FILE"
 
 # Configure kernel modules (idempotent)
 MODULES_FILE="/etc/modules"
@@ -2,10 +2,19 @@
 import vlc
 import time
 
+_instance = None
+
+def get_instance():
+    """Gemeinsame VLC Instance, Plugin-Scan und Audio-Setup laufen nur einmal"""
+    global _instance
+    if _instance is None:
+        _instance = vlc.Instance('--quiet', "--aout=alsa")
+    return _instance
+
 def test_vlc():
+    player = None
     try:
-        # Erstelle eine VLC Instance
-        instance = vlc.Instance('--verbose=2', "--aout=alsa")
+        instance = get_instance()
         
         # Erstelle einen Media Player
         player = instance.media_player_new()
@@ -29,9 +38,9 @@ def test_vlc():
         print(f"Fehler: {e}")
         
     finally:
-        player.stop()
-        player.release()
-        instance.release()
+        if player:
+            player.stop()
+            player.release()
 
 
 if __name__ == "__main__":
@@ -3,7 +3,13 @@ import vlc
 import time
 import signal
 import sys
+import os
 import subprocess
+import tempfile
+
+# Marker for "alsactl init already ran"; the runtime dir is emptied on reboot
+ALSA_INIT_MARKER = os.path.join(os.environ.get('XDG_RUNTIME_DIR') or tempfile.gettempdir(),
+                                'radiowecker-alsactl-init')
 
 def signal_handler(sig, frame):
     print('\nStopping playback...')
@@ -14,14 +20,24 @@ def signal_handler(sig, frame):
         instance.release()
     sys.exit(0)
 
+def init_alsa():
+    """Run alsactl init once per boot instead of on every start"""
+    if os.path.exists(ALSA_INIT_MARKER):
+        return
+    subprocess.run(['alsactl', 'init'], check=False)
+    try:
+        open(ALSA_INIT_MARKER, 'w').close()
+    except OSError:
+        pass
+
 def test_radio():
     global player, instance
     try:
         # Initialize ALSA
-        subprocess.run(['alsactl', 'init'], check=False)
+        init_alsa()
         
         # Create VLC instance with ALSA audio output
-        instance = vlc.Instance('--verbose=2',
+        instance = vlc.Instance('--quiet',
                               '--aout=pulse',
                               # '--alsa-audio-device=hw:0'
                               )
@@ -0,0 +1,84 @@
+# tests/test_hardware_input.py
+
+import asyncio
+import os
+import sys
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+import hardware
+
+
+class FakePygameManager:
+    """Stands in for the pygame window, HardwareInput only subscribes to it"""
+
+    @classmethod
+    def get_instance(cls):
+        return cls()
+
+    def subscribe(self, fn):
+        pass
+
+
+def make_input(monkeypatch):
+    monkeypatch.setattr(hardware, "PygameManager", FakePygameManager, raising=False)
+    monkeypatch.setattr(hardware, "RPI_HARDWARE", False)
+    events = []
+    hw = hardware.HardwareInput(lambda name, pressed: events.append(name))
+    return hw, events
+
+
+def test_short_taps_are_all_reported(monkeypatch):
+    hw, events = make_input(monkeypatch)
+    t = 100.0
+    # Release 30 ms after the press, inside BUTTON_DEBOUNCE_TIME
+    for dt, state in ((0, True), (0.03, False), (0.5, True), (0.6, False), (1.0, True)):
+        hw.process_button(0, state, t + dt)
+
+    assert events == ["power"] * 3
+    assert hw.button_pressed.tolist() == [1, 0, 0, 0, 0]
+
+
+def test_press_bounce_is_ignored(monkeypatch):
+    hw, events = make_input(monkeypatch)
+    t = 100.0
+    for dt, state in ((0, True), (0.005, False), (0.01, True), (0.2, False)):
+        hw.process_button(0, state, t + dt)
+
+    assert events == ["power"]
+    assert not hw.is_any_pressed()
+
+
+def test_bouncing_press_polled_fires_once(monkeypatch):
+    hw, events = make_input(monkeypatch)
+    clock = [100.0]
+    monkeypatch.setattr(hardware.time, "monotonic", lambda: clock[0])
+    pin = int(hw.button_pins[0])
+
+    def level(ms):
+        # Held for 200 ms, contact bounces open 2-4 ms into the press
+        return 0 < ms < 200 and not 2 <= ms <= 4
+
+    # Sample the line at the 1 ms rate of poll_inputs
+    for ms in range(300):
+        clock[0] = 100.0 + ms / 1000
+        monkeypatch.setattr(hw, "read_levels", lambda: (1 << pin) if level(ms) else 0)
+        hw.check_gpio_buttons()
+
+    assert events == ["power"]
+    assert not hw.is_any_pressed()
+
+
+def test_quick_release_without_further_edges_is_confirmed(monkeypatch):
+    hw, events = make_input(monkeypatch)
+
+    async def tap():
+        now = hardware.time.monotonic()
+        hw.process_button(0, True, now)
+        hw.process_button(0, False, now + 0.01)
+        # No more edges arrive: the pending release has to confirm itself
+        await asyncio.sleep(hardware.BUTTON_DEBOUNCE_TIME + 0.05)
+
+    asyncio.run(tap())
+    assert events == ["power"]
+    assert not hw.is_any_pressed()
@@ -0,0 +1,34 @@
+# tests/test_settings.py
+
+import os
+import sys
+from datetime import datetime
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from settings import Settings
+
+
+def make_settings(monkeypatch, tmp_path):
+    # No settings.json there, so the defaults apply: alarms at 07:00 and 08:00
+    monkeypatch.chdir(tmp_path)
+    return Settings()
+
+
+def test_alarm_due_when_starting_in_its_minute(monkeypatch, tmp_path):
+    settings = make_settings(monkeypatch, tmp_path)
+    now = datetime(2026, 10, 16, 7, 0, 30).timestamp()
+
+    due = settings.next_alarm_time(now)
+
+    assert due == datetime(2026, 10, 16, 7, 0).timestamp()
+    assert due <= now
+
+
+def test_next_alarm_after_its_minute(monkeypatch, tmp_path):
+    settings = make_settings(monkeypatch, tmp_path)
+
+    assert (settings.next_alarm_time(datetime(2026, 10, 16, 7, 1).timestamp())
+            == datetime(2026, 10, 16, 8, 0).timestamp())
+    assert (settings.next_alarm_time(datetime(2026, 10, 16, 8, 1).timestamp())
+            == datetime(2026, 10, 17, 7, 0).timestamp())
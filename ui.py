@@ -15,21 +15,29 @@ class UIMode(Enum):
     VOLUME = "volume"
 
 
+SOURCES = ("RADIO", "USB", "SD_CARD", "INTERNET", "BLUETOOTH")
+
+
 class UIState:
     def __init__(self):
         # Display regions
         self.HEADER_HEIGHT = 10
         self.FOOTER_HEIGHT = 8
         self.CONTENT_START = self.HEADER_HEIGHT + 2
+        # 5x8 glyphs plus spacing, 4 entries fit below the header
+        self.BROWSER_LINE_HEIGHT = 12
 
         # General state
         self.mode = UIMode.NORMAL
         self.standby = False
         self.volume_overlay_timeout = 0
+        # Set whenever something visible changes, cleared by the main loop after drawing
+        self.dirty = True
 
         # Sources
-        self.sources = ["RADIO", "USB", "SD_CARD", "INTERNET", "BLUETOOTH"]
+        self.sources = SOURCES
         self.current_source = 0
+        self.current_source_name = SOURCES[0]
 
         # Volume control
         self.volume_control = VolumeControl()
@@ -42,27 +50,21 @@ class UIState:
         # File browser index
         self.selected_file_idx = 1
 
-        # Button states
-        self.button_states = {
-            "power": False,
-            "source": False,
-            "menu": False,
-            "alarm1": False,
-            "alarm2": False
-        }
-
 
     def get_current_source(self) -> str:
         """Get name of current source"""
-        return self.sources[self.current_source]
+        return self.current_source_name
 
     def next_source(self):
         """Switch to next source"""
-        self.current_source = (self.current_source + 1) % len(self.sources)
-        print("Switched to source:", self.get_current_source())
-        if self.get_current_source() == "USB":
+        self.current_source += 1
+        if self.current_source >= len(self.sources):
+            self.current_source = 0
+        source = self.current_source_name = self.sources[self.current_source]
+        print("Switched to source:", source)
+        if source == "USB":
             self.mode = UIMode.FILE_BROWSER
-        elif self.get_current_source() == "SD_CARD":
+        elif source == "SD_CARD":
             self.mode = UIMode.SD_CARD_BROWSER
         else:
             self.mode = UIMode.NORMAL
@@ -82,6 +84,8 @@ class UI:
         self.hardware_out = hardware_out
         self.last_volume_change = 0
         self.VOLUME_OVERLAY_DURATION = 2.0
+        # (epoch minute, "HH:MM") so header and standby clock format once per minute
+        self._clock_cache = (0, "")
 
     def set_hardware_input(self, hardware_in):
         """Set hardware input reference to get button states"""
@@ -117,14 +121,24 @@ class UI:
         self.render_button_indicators()
         self.display.show()
 
+    def clock_text(self) -> str:
+        """Current time as HH:MM, formatted at most once per minute"""
+        # UTC offsets are whole minutes, so the local minute flips with the epoch minute
+        minute = int(time.time()) // 60
+        if minute != self._clock_cache[0]:
+            now = time.localtime(minute * 60)
+            self._clock_cache = (minute, f"{now.tm_hour:02d}:{now.tm_min:02d}")
+        return self._clock_cache[1]
+
     def render_header(self):
         """Render status bar"""
-        time_str = time.strftime("%H:%M")
+        time_str = self.clock_text()
         self.display.buffer.draw_text(self.display.width - 30, 0, time_str)
 
         source = self.state.get_current_source()
         self.display.buffer.draw_text(0, 0, source)
 
+        # Fixed labels, their column masks come from the buffer's text cache
         if self.state.alarm_mode & 1:
             self.display.buffer.draw_text(60, 0, "A1")
         if self.state.alarm_mode & 2:
@@ -148,13 +162,12 @@ class UI:
 
         y = self.display.height - 1
         button_width = 1
-        spacing = (self.display.width - (5 * button_width)) // 6
-
-        buttons = ["power", "source", "menu", "alarm1", "alarm2"]
+        count = len(self.hardware_in.button_pressed)
+        spacing = (self.display.width - (count * button_width)) // (count + 1)
 
-        for i, button in enumerate(buttons):
+        for i, pressed in enumerate(self.hardware_in.button_pressed):
             x = spacing + i * (button_width + spacing)
-            if self.hardware_in.buttons[button].pressed:
+            if pressed:
                 self.display.buffer.set_pixel(x, y, True)
 
     def render_normal(self):
@@ -221,56 +234,19 @@ class UI:
 
     def render_file_browser(self):
         """Render file browser"""
-        files = self.audio.get_current_files()
-        if not files or len(files) == 0:
-            # Don't clear the display here, just show the message
-            self.display.buffer.draw_text(0, self.state.CONTENT_START, "No files found")
-            return
-
-        # Get current file based on index
-        current_idx = self.state.selected_file_idx
-        if current_idx >= len(files):
-            current_idx = 0
-            self.state.selected_file_idx = 0
-
-        # Calculate which files to display
-        start_idx = max(0, current_idx - 1)
-        end_idx = min(len(files), start_idx + 4)
-        
-        # Adjust start_idx if we have fewer than 4 files to display
-        if end_idx - start_idx < 4:
-            start_idx = max(0, end_idx - 4)
-        
-        # Display files
-        line = 0
-        for i in range(start_idx, end_idx):
-            file = files[i]
-            prefix = ">" if i == current_idx else " "
-            
-            # Add play indicator if this is the currently playing file
-            if (self.audio.current_file and self.audio.current_file == file and 
-                self.audio.source == AudioSource.USB):
-                prefix = "▶"
-                
-            name = file.name
-            
-            # Add brackets for directories
-            if file.is_dir and not file.is_special:
-                name = f"[{name}]"
-                
-            if len(name) > 19:
-                name = name[:16] + "..."
-                
-            y_pos = self.state.CONTENT_START + (line * 12)  # Start from content area
-            self.display.buffer.draw_text(0, y_pos, f"{prefix}{name}")
-            line += 1
+        playing = self.audio.current_file if self.audio.source == AudioSource.USB else None
+        self._render_file_list(self.audio.get_current_files(), playing, "No files found")
 
     def render_sd_card_browser(self):
         """Render SD card browser"""
-        files = self.audio.get_sd_card_files()
-        if not files or len(files) == 0:
+        playing = self.audio.current_sd_file if self.audio.source == AudioSource.SD_CARD else None
+        self._render_file_list(self.audio.get_sd_card_files(), playing, "No SD card files")
+
+    def _render_file_list(self, files, playing, empty_text):
+        """Render a 4-line window of files around the selection"""
+        if not files:
             # Don't clear the display here, just show the message
-            self.display.buffer.draw_text(0, self.state.CONTENT_START, "No SD card files")
+            self.display.buffer.draw_text(0, self.state.CONTENT_START, empty_text)
             return
 
         # Get current file based on index
@@ -279,41 +255,33 @@ class UI:
             current_idx = 0
             self.state.selected_file_idx = 0
 
-        # Calculate which files to display
-        start_idx = max(0, current_idx - 1)
-        end_idx = min(len(files), start_idx + 4)
-        
-        # Adjust start_idx if we have fewer than 4 files to display
-        if end_idx - start_idx < 4:
-            start_idx = max(0, end_idx - 4)
-        
-        # Display files
-        line = 0
-        for i in range(start_idx, end_idx):
-            file = files[i]
-            prefix = ">" if i == current_idx else " "
-            
-            # Add play indicator if this is the currently playing file
-            if (self.audio.current_sd_file and self.audio.current_sd_file == file and 
-                self.audio.source == AudioSource.SD_CARD):
+        # Window of up to 4 files starting one above the selection,
+        # shifted back at the end of the list
+        start_idx = max(0, min(current_idx - 1, len(files) - 4))
+
+        y_pos = self.state.CONTENT_START
+        for i, file in enumerate(files[start_idx:start_idx + 4], start_idx):
+            if playing is not None and file == playing:
+                # Play indicator for the currently playing file
                 prefix = "▶"
-                
+            else:
+                prefix = ">" if i == current_idx else " "
+
             name = file.name
-            
+
             # Add brackets for directories
             if file.is_dir and not file.is_special:
                 name = f"[{name}]"
-                
+
             if len(name) > 19:
                 name = name[:16] + "..."
-                
-            y_pos = self.state.CONTENT_START + (line * 12)  # Start from content area
+
             self.display.buffer.draw_text(0, y_pos, f"{prefix}{name}")
-            line += 1
+            y_pos += self.state.BROWSER_LINE_HEIGHT
 
     def render_standby_clock(self):
         """Render large centered clock for standby mode"""
-        time_str = time.strftime("%H:%M")
+        time_str = self.clock_text()
         x = (self.display.width - len(time_str) * 9) // 2
         y = (self.display.height - 16) // 2
         self.display.buffer.draw_text(x, y, time_str, size="8x16")
@@ -350,6 +318,7 @@ class UI:
     def handle_button(self, button: str, pressed: bool):
         """Handle button and encoder events"""
         current_time = time.time()
+        self.state.dirty = True
 
         if button.startswith("volume_"):
             if pressed:
@@ -379,7 +348,9 @@ class UI:
                                     current_idx = stations.index(self.audio.current_station)
                                 except ValueError:
                                     pass
-                            next_idx = (current_idx + 1) % len(stations)
+                            next_idx = current_idx + 1
+                            if next_idx >= len(stations):
+                                next_idx = 0
                             self.audio.play_station(stations[next_idx])
                     elif button == "control_ccw":
                         # Previous station
@@ -391,7 +362,9 @@ class UI:
                                     current_idx = stations.index(self.audio.current_station)
                                 except ValueError:
                                     pass
-                            prev_idx = (current_idx - 1) % len(stations)
+                            prev_idx = current_idx - 1
+                            if prev_idx < 0:
+                                prev_idx = len(stations) - 1
                             self.audio.play_station(stations[prev_idx])
                     elif button == "control_press":
                         # Toggle play/pause for current station
@@ -510,73 +483,47 @@ class UI:
                 self.state.selected_file_idx = 0
             self.render()
 
+    def _move_selection(self, files: list, step: int):
+        """Move the browser selection by step (+1/-1), wrapping at both ends.
+        No render here, the main loop redraws right after input."""
+        idx = self.state.selected_file_idx + step
+        if idx < 0:
+            idx = len(files) - 1
+        elif idx >= len(files):
+            idx = 0
+        self.state.selected_file_idx = idx
+
     def select_next_file(self):
         """Select the next file in the file browser"""
-        if not self.audio.get_current_files():
+        files = self.audio.get_current_files()
+        if not files:
             print("No files to navigate")
             return
-            
-        try:
-            # Increment the file index
-            self.state.selected_file_idx = (self.state.selected_file_idx + 1) % len(self.audio.get_current_files())
-            self.render()
-        except Exception as e:
-            print(f"Error selecting next file: {e}")
-            # Reset the file index to a safe value
-            if self.audio.get_current_files():
-                self.state.selected_file_idx = 0
-            self.render()
+        self._move_selection(files, 1)
 
     def select_prev_file(self):
         """Select the previous file in the file browser"""
-        if not self.audio.get_current_files():
+        files = self.audio.get_current_files()
+        if not files:
             print("No files to navigate")
             return
-            
-        try:
-            # Decrement the file index
-            self.state.selected_file_idx = (self.state.selected_file_idx - 1) % len(self.audio.get_current_files())
-            self.render()
-        except Exception as e:
-            print(f"Error selecting previous file: {e}")
-            # Reset the file index to a safe value
-            if self.audio.get_current_files():
-                self.state.selected_file_idx = 0
-            self.render()
+        self._move_selection(files, -1)
 
     def select_next_sd_file(self):
         """Select the next file in the SD card file browser"""
-        if not self.audio.get_sd_card_files():
+        files = self.audio.get_sd_card_files()
+        if not files:
             print("No SD card files to navigate")
             return
-            
-        try:
-            # Increment the file index
-            self.state.selected_file_idx = (self.state.selected_file_idx + 1) % len(self.audio.get_sd_card_files())
-            self.render()
-        except Exception as e:
-            print(f"Error selecting next SD card file: {e}")
-            # Reset the file index to a safe value
-            if self.audio.get_sd_card_files():
-                self.state.selected_file_idx = 0
-            self.render()
+        self._move_selection(files, 1)
 
     def select_prev_sd_file(self):
         """Select the previous file in the SD card file browser"""
-        if not self.audio.get_sd_card_files():
+        files = self.audio.get_sd_card_files()
+        if not files:
             print("No SD card files to navigate")
             return
-            
-        try:
-            # Decrement the file index
-            self.state.selected_file_idx = (self.state.selected_file_idx - 1) % len(self.audio.get_sd_card_files())
-            self.render()
-        except Exception as e:
-            print(f"Error selecting previous SD card file: {e}")
-            # Reset the file index to a safe value
-            if self.audio.get_sd_card_files():
-                self.state.selected_file_idx = 0
-            self.render()
+        self._move_selection(files, -1)
 
     def show_main_menu(self):
         """Show main menu"""